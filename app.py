@@ -1,13 +1,14 @@
 
+import importlib
+import os
 import streamlit as st
-from components.chatbot import chatbot_page
-from components.networking import networking_ui
-from components.resume_upload import resume_upload_ui
-from training.predict import get_job_recommendation
-from components.youtube_search import youtube_search_ui
+from utils.metrics import METRICS, export_prometheus, profiled, span, start_metrics_server
 
 st.set_page_config(page_title="AI Career Mentor", layout="wide")
 
+# 📈 Serve /metrics for Prometheus when METRICS_PORT is set (started once per process)
+start_metrics_server()
+
 # ✅ Ensure session state exists
 if "is_mobile" not in st.session_state:
     st.session_state.is_mobile = False  # Default to Desktop Mode
@@ -24,54 +25,83 @@ else:
     st.write("💻 **Desktop Mode Enabled**")
 
 # ✅ Main Content
+# Pages are "module:function" strings imported on first selection, so a rerun only pays for
+# the page being shown (python -m utils.startup_profile reports what each one costs)
 PAGES = {
-    "💬 Chatbot": chatbot_page,
-    "🤝 Networking": networking_ui,
-    "📂 Resume Upload": resume_upload_ui,
-    "🎥 YouTube Career Search": youtube_search_ui,
+    "💬 Chatbot": "components.chatbot:chatbot_page",
+    "🤝 Networking": "components.networking:networking_ui",
+    "📂 Resume Upload": "components.resume_upload:resume_upload_ui",
+    "🎥 YouTube Career Search": "components.youtube_search:youtube_search_ui",
     "🏆 Job Prediction": "job_prediction"  # Placeholder for handling Job Prediction separately
 }
 
+def load_page(target):
+    """Resolve a "module:function" page target (modules stay cached in sys.modules across reruns)."""
+    module_name, function_name = target.split(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
 st.sidebar.title("📍 Navigation")
 selection = st.sidebar.radio("Go to:", list(PAGES.keys()))
 
-# 🎯 **Handle Job Prediction Section**
-if selection == "🏆 Job Prediction":
-    st.title("🏆 AI-Powered Career Recommendation")
-    skills_input = st.text_area("📝 **Enter Your Skills (comma-separated):**", placeholder="e.g., Python, Machine Learning, SQL")
-    if st.button("🔍 Get Career Prediction"):
-        if skills_input.strip():
-            # Pass the skills input as a string
-            result = get_job_recommendation(skills_input)
-            if "error" in result:
-                st.error(result["error"])
-            else:
-                st.success(f"🏅 **Recommended Job Role:** {result['job_title']}  \n🎯 **Confidence Score:** {result['confidence']}%")
-                # 🔹 Salary & Demand Insights Section
-                st.markdown("---")
-                st.subheader("💰 Salary & Demand Insights")
-                st.markdown(f"**💵 Salary Range:** {result['avg_salary']}" )
-                st.markdown(f"**📈 Demand Level:** {result['demand_level']}")
-                # 📊 Market Insights Section
-                st.markdown("---")
-                st.subheader("📊 Market Insights")
-                st.markdown(result["market_insights"], unsafe_allow_html=True)
-                # 🚀 Skills Improvement Section
-                st.markdown("---")
-                st.subheader("🚀 Key Skills to Improve")
-                st.write(result["skills_improvement"])
-                # 🔄 Alternative Career Paths Section
-                st.markdown("---")
-                st.subheader("🎯 Alternative Career Paths")
-                if result["alternative_jobs"]:
-                    st.markdown(result["alternative_jobs"], unsafe_allow_html=True)
+# ⏱ Every page render is timed (and optionally profiled) per PAGES entry
+with span("page.render", page=selection), profiled(st.session_state.get("profile_pages", False)) as profile:
+    # 🎯 **Handle Job Prediction Section**
+    if selection == "🏆 Job Prediction":
+        st.title("🏆 AI-Powered Career Recommendation")
+        skills_input = st.text_area("📝 **Enter Your Skills (comma-separated):**", placeholder="e.g., Python, Machine Learning, SQL")
+        if st.button("🔍 Get Career Prediction"):
+            if skills_input.strip():
+                # Remote when PREDICTION_SERVER_URL is set; otherwise pandas/scikit-learn load only when used
+                from utils.prediction_client import get_job_recommendation
+
+                # Pass the skills input as a string
+                result = get_job_recommendation(skills_input)
+                if "error" in result:
+                    st.error(result["error"])
                 else:
-                    st.write("⚠ No strong alternative career matches found.")
-        else:
-            st.warning("⚠ **Please enter your skills to get a career recommendation.**")
-else:
-    if PAGES[selection] != "job_prediction":  # Check if it's not the placeholder
-        PAGES[selection]()  # ✅ Correctly call UI functions
+                    st.success(f"🏅 **Recommended Job Role:** {result['job_title']}  \n🎯 **Confidence Score:** {result['confidence']}%")
+                    # 🔹 Salary & Demand Insights Section
+                    st.markdown("---")
+                    st.subheader("💰 Salary & Demand Insights")
+                    st.markdown(f"**💵 Salary Range:** {result['avg_salary']}" )
+                    st.markdown(f"**📈 Demand Level:** {result['demand_level']}")
+                    # 📊 Market Insights Section
+                    st.markdown("---")
+                    st.subheader("📊 Market Insights")
+                    st.markdown(result["market_insights"], unsafe_allow_html=True)
+                    # 🚀 Skills Improvement Section
+                    st.markdown("---")
+                    st.subheader("🚀 Key Skills to Improve")
+                    st.write(result["skills_improvement"])
+                    # 🔄 Alternative Career Paths Section
+                    st.markdown("---")
+                    st.subheader("🎯 Alternative Career Paths")
+                    if result["alternative_jobs"]:
+                        st.markdown(result["alternative_jobs"], unsafe_allow_html=True)
+                    else:
+                        st.write("⚠ No strong alternative career matches found.")
+            else:
+                st.warning("⚠ **Please enter your skills to get a career recommendation.**")
+    else:
+        if PAGES[selection] != "job_prediction":  # Check if it's not the placeholder
+            load_page(PAGES[selection])()  # ✅ Correctly call UI functions
+
+if profile["report"]:
+    with st.expander("🧪 cProfile: this page render"):
+        st.code(profile["report"])
+
+def diagnostics_requested():
+    """?diagnostics=1 in the URL; the pinned streamlit 1.28 only has the experimental query-params API."""
+    if hasattr(st, "experimental_get_query_params"):
+        return st.experimental_get_query_params().get("diagnostics") == ["1"]
+    return st.query_params.get("diagnostics") == "1"
+
+# 🛠 Diagnostics for this session only: open the app with ?diagnostics=1 (or set APP_DIAGNOSTICS=1)
+if os.getenv("APP_DIAGNOSTICS") == "1" or diagnostics_requested():
+    with st.sidebar.expander("🛠 Diagnostics"):
+        st.checkbox("Profile page renders (cProfile)", key="profile_pages")
+        st.dataframe(METRICS.summary(), use_container_width=True)
+        st.download_button("⬇ Prometheus metrics", export_prometheus(), file_name="metrics.prom")
 
 # ✅ Footer - Made by Zainab (LinkedIn) at the bottom
 st.markdown("<style>body { padding-bottom: 60px; }</style>", unsafe_allow_html=True)
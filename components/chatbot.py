@@ -1,48 +1,47 @@
-def get_chatbot_response(user_input):
-    url = "https://api.mistral.ai/v1/chat/completions"
-
-    headers = {
-        "Authorization": f"Bearer {MISTRAL_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    payload = {
-        "model": "mistral-medium",
-        "messages": [{"role": "user", "content": user_input}],
-        "temperature": 0.7
-    }
-
-import requests
+import time
 import streamlit as st
-import os
-from dotenv import load_dotenv
+from utils.chat_context import build_messages, new_summary_state, schedule_fold
+from utils.llm_client import LLMError, chat_completion, stream_chat_completion
 
-# Load environment variables
-load_dotenv()
-
-# Mistral API Key
-MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
+def conversation_messages(user_input):
+    """Bounded context for the current session: rolling summary + recent turns + user_input."""
+    if "chat_summary" not in st.session_state:
+        st.session_state.chat_summary = new_summary_state()
+    history = st.session_state.get("chat_history", [])
+    return build_messages(history, user_input, st.session_state.chat_summary)
 
 # Function to interact with Mistral API
-def get_chatbot_response(user_input):
-    url = "https://api.mistral.ai/v1/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {MISTRAL_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    payload = {
-        "model": "mistral-medium",
-        "messages": [{"role": "user", "content": user_input}],
-        "temperature": 0.7
-    }
+def get_chatbot_response(user_input, messages=None):
+    try:
+        return chat_completion(messages or [{"role": "user", "content": user_input}], name="chatbot")
+    except LLMError as e:
+        if e.status_code is None:
+            return f"⚠️ Error: Unable to fetch response. ({e})"
+        return f"⚠️ Error: Unable to fetch response. (Status Code: {e.status_code})"
 
-    response = requests.post(url, headers=headers, json=payload)
+# Streamed variant: yields the answer token by token as Mistral produces it
+def stream_chatbot_response(user_input, messages=None):
+    try:
+        yield from stream_chat_completion(messages or [{"role": "user", "content": user_input}], name="chatbot.stream")
+    except LLMError as e:
+        if e.status_code is None:
+            yield f"⚠️ Error: Unable to fetch response. ({e})"
+        else:
+            yield f"⚠️ Error: Unable to fetch response. (Status Code: {e.status_code})"
 
-    if response.status_code == 200:
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
-    else:
-        return f"⚠️ Error: Unable to fetch response. (Status Code: {response.status_code})"
+def render_streamed_response(user_input, messages=None):
+    """Render tokens into the assistant message as they arrive; returns (full_text, ttft_seconds)."""
+    placeholder = st.empty()
+    text = ""
+    ttft = None
+    start = time.perf_counter()
+    for token in stream_chatbot_response(user_input, messages):
+        if ttft is None:
+            ttft = time.perf_counter() - start
+        text += token
+        placeholder.markdown(text + "▌")
+    placeholder.markdown(text)
+    return text, ttft
 
 # Chatbot UI
 def chatbot_page():
@@ -55,21 +54,34 @@ def chatbot_page():
     # Resume chat if selected from history
     if "selected_chat" in st.session_state and st.session_state.selected_chat:
         st.session_state.chat_history = st.session_state.selected_chat
+        st.session_state.chat_summary = new_summary_state()
         del st.session_state.selected_chat  # Clear after loading
 
     # Display chat history
     for chat in st.session_state.chat_history:
         st.chat_message(chat["role"]).write(chat["content"])
 
+    stream_responses = st.checkbox("⚡ Stream responses", value=True)
+
     # User input
     user_input = st.chat_input("Ask a career-related question:")
     if user_input:
         st.chat_message("user").write(user_input)
+        messages = conversation_messages(user_input)
 
         # Get AI response
-        ai_response = get_chatbot_response(user_input)
-        st.chat_message("assistant").write(ai_response)
+        if stream_responses:
+            with st.chat_message("assistant"):
+                ai_response, ttft = render_streamed_response(user_input, messages)
+            if ttft is not None:
+                st.session_state.last_ttft_ms = ttft * 1000
+                st.caption(f"⏱ First token after {st.session_state.last_ttft_ms:.0f} ms")
+        else:
+            ai_response = get_chatbot_response(user_input, messages)
+            st.chat_message("assistant").write(ai_response)
 
         # Store in chat history
         st.session_state.chat_history.append({"role": "user", "content": user_input})
         st.session_state.chat_history.append({"role": "assistant", "content": ai_response})
+        # Summarize older turns in the background, after the answer is already on screen
+        schedule_fold(st.session_state.chat_history, st.session_state.chat_summary)
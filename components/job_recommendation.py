@@ -1,5 +1,5 @@
 import streamlit as st
-from training.predict import predict_career
+from utils.prediction_client import get_job_recommendation
 
 def job_recommendation_ui():
     st.title("🔍 Job Recommendations")
@@ -8,20 +8,21 @@ def job_recommendation_ui():
     
     if st.button("Find Jobs"):
         if skills_input:
-            results = predict_career(skills_input)
-            if results:
+            results = get_job_recommendation(skills_input)
+            if "error" not in results:
                 st.success("✅ Career Recommendations:")
                 st.write(f"**🏆 Recommended Job:** {results['job_title']}")
                 st.write(f"**🔢 Confidence:** {results['confidence']}%")
-                st.write(f"**📍 Location:** {results['location']}")
-                st.write(f"**💰 Salary Range:** {results['salary']}")
-                st.write(f"**🛠 Suggested Skills:** {', '.join(results['suggested_skills'])}")
+                st.write(f"**💰 Salary Range:** {results['avg_salary']}")
+                st.write(f"**📈 Demand Level:** {results['demand_level']}")
+                st.write(f"**🛠 Suggested Skills:** {results['skills_improvement']}")
 
                 st.subheader("🔄 Alternative Careers")
-                for job, match in results["alternative_jobs"].items():
-                    st.write(f"• {job} (Skill match: {match}%)")
+                for job in results["top_jobs"][1:]:
+                    if job["job_title"]:
+                        st.write(f"• {job['job_title']} (Skill match: {job['confidence']}%)")
 
             else:
-                st.warning("⚠ No job recommendations found.")
+                st.warning(f"⚠ No job recommendations found. ({results['error']})")
         else:
             st.error("❌ Please enter your skills.")
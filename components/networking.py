@@ -1,50 +1,95 @@
 
 import requests
 import streamlit as st
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 import os
+import threading
 from dotenv import load_dotenv
+from utils.helpers import TTLCache
+from utils.metrics import span
+from utils.llm_client import LLMError, chat_completion
 
 # Load environment variables
 load_dotenv()
 
 # 🔑 API Keys
-MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 SEARCH_ENGINE_ID = os.getenv("SEARCH_ENGINE_ID")
+GOOGLE_SEARCH_URL = os.getenv("GOOGLE_SEARCH_URL") or "https://www.googleapis.com/customsearch/v1"
+
+# 🔎 Custom Search caching & quota (free tier: 100 queries/day)
+SEARCH_CACHE_TTL = 6 * 60 * 60
+SEARCH_TIMEOUT = 10
+GOOGLE_SEARCH_DAILY_QUOTA = int(os.getenv("GOOGLE_SEARCH_DAILY_QUOTA", "100"))
+_search_cache = TTLCache(ttl=SEARCH_CACHE_TTL, max_entries=2048)
+_search_session = requests.Session()
+_search_quota = {"date": None, "requests": 0}
+_quota_lock = threading.Lock()
+
+# ⏳ How long identical Mistral prompts are served from the completion cache
+EVENT_SUMMARY_CACHE_TTL = 24 * 60 * 60
+STRATEGIES_CACHE_TTL = 7 * 24 * 60 * 60
+
+# 🧵 Concurrent external calls per page render (1 search + up to 5 summaries + 2 insight calls)
+NETWORKING_MAX_WORKERS = 8
 
 # ✅ Fetch Latest Networking Events from Google Search API
+def normalize_query(query):
+    """Case- and whitespace-insensitive form of a search query, used as the cache key."""
+    return " ".join(query.lower().split())
+
+def _google_search(query, num_results):
+    """One Custom Search request for exactly num_results items; raises on non-200 so errors are not cached."""
+    _record_search_quota()
+    with span("google.search") as search_span:
+        response = _search_session.get(
+            GOOGLE_SEARCH_URL,
+            params={"q": query, "key": GOOGLE_API_KEY, "cx": SEARCH_ENGINE_ID, "num": min(max(num_results, 1), 10)},
+            timeout=SEARCH_TIMEOUT,
+        )
+        search_span.add_bytes(len(response.content))
+        response.raise_for_status()
+        return response.json().get("items", [])
+
+def _record_search_quota():
+    today = datetime.today().date().isoformat()
+    with _quota_lock:
+        if _search_quota["date"] != today:
+            _search_quota.update(date=today, requests=0)
+        _search_quota["requests"] += 1
+        if _search_quota["requests"] == GOOGLE_SEARCH_DAILY_QUOTA:
+            print(f"⚠ Google Custom Search daily quota reached ({GOOGLE_SEARCH_DAILY_QUOTA} requests).")
+
+def get_search_quota_usage():
+    """Custom Search requests sent today (per process) plus cache effectiveness."""
+    with _quota_lock:
+        usage = dict(_search_quota)
+    return {**usage, "daily_quota": GOOGLE_SEARCH_DAILY_QUOTA, "cache": _search_cache.stats()}
+
 def fetch_google_search_results(query, num_results=5):
-    url = f"https://www.googleapis.com/customsearch/v1?q={query}&key={GOOGLE_API_KEY}&cx={SEARCH_ENGINE_ID}"
-    response = requests.get(url)
+    """
+    Search results for query, served from a shared TTL cache keyed on the normalized query.
 
-    if response.status_code == 200:
-        results = response.json().get("items", [])
-        return results[:num_results] if results else []
-    else:
+    Concurrent identical queries share one in-flight request, and only num_results items are
+    requested from the API.
+    """
+    normalized = normalize_query(query)
+    try:
+        return _search_cache.get_or_compute((normalized, num_results), lambda: _google_search(normalized, num_results))
+    except requests.exceptions.RequestException:
         return []
 
 # ✅ Summarize Event Details Using Mistral AI
 def summarize_event_details(event_title, event_link):
-    url = "https://api.mistral.ai/v1/chat/completions"
-    headers = {"Authorization": f"Bearer {MISTRAL_API_KEY}", "Content-Type": "application/json"}
-
     prompt = (
         f"Visit the event link: {event_link} and summarize its purpose, agenda, and audience in 3 lines."
     )
 
-    payload = {
-        "model": "mistral-medium",
-        "messages": [{"role": "user", "content": prompt}],
-        "temperature": 0.7
-    }
-
-    response = requests.post(url, headers=headers, json=payload)
-
-    if response.status_code == 200:
-        summary = response.json()["choices"][0]["message"]["content"]
+    try:
+        summary = chat_completion([{"role": "user", "content": prompt}], name="networking.event_summary", cache_ttl=EVENT_SUMMARY_CACHE_TTL)
         return f"🎟 **{event_title}**\n📄 {summary}\n🔗 [Event Link]({event_link})"
-    else:
+    except LLMError:
         return f"🎟 **{event_title}**\n⚠ Unable to fetch details. Visit: [Click Here]({event_link})"
 
 # ✅ AI-Powered Networking Strategies
@@ -63,20 +108,9 @@ def get_ai_networking_insights(profession, location, concern):
         f"Summarize into 5 actionable points."
     )
 
-    url = "https://api.mistral.ai/v1/chat/completions"
-    headers = {"Authorization": f"Bearer {MISTRAL_API_KEY}", "Content-Type": "application/json"}
-
-    payload = {
-        "model": "mistral-medium",
-        "messages": [{"role": "user", "content": prompt}],
-        "temperature": 0.7
-    }
-
-    response = requests.post(url, headers=headers, json=payload)
-
-    if response.status_code == 200:
-        return response.json()["choices"][0]["message"]["content"]
-    else:
+    try:
+        return chat_completion([{"role": "user", "content": prompt}], name="networking.strategies", cache_ttl=STRATEGIES_CACHE_TTL)
+    except LLMError:
         return "⚠ Error: Unable to fetch AI-powered strategies."
 
 # ✅ Fetch Networking Insights Using Mistral AI
@@ -84,32 +118,67 @@ def get_networking_insights(profession, location, concern):
     """
     Fetches networking events, seminars, and career insights based on user inputs.
     """
-
-
-    headers = {
-        "Authorization": f"Bearer {MISTRAL_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
     prompt = (
         f"Provide a list of upcoming networking events, seminars, or career opportunities "
         f"for a {profession} in {location}. Also, offer some general networking strategies "
         f"to address this concern: {concern}."
     )
 
-    payload = {
-        "model": "mistral-medium",
-        "messages": [{"role": "user", "content": prompt}],
-        "temperature": 0.7
-    }
+    try:
+        return chat_completion([{"role": "user", "content": prompt}], name="networking.insights")
+    except LLMError as e:
+        return f"⚠ Error: Unable to fetch insights. (Status Code: {e.status_code})"
 
-    response = requests.post(url, headers=headers, json=payload)
-
-    if response.status_code == 200:
-        data = response
-        return data["choices"][0]["message"]["content"]
-    else:
-        return f"⚠ Error: Unable to fetch insights. (Status Code: {response.status_code})"
+# ✅ Fetch all sections concurrently and render each one as soon as it arrives
+def render_networking_results(profession, location, concern):
+    """
+    The event search, the strategies lookup and the insights call are independent, so they
+    start together on a bounded thread pool; event summaries start as soon as the search
+    returns. Placeholders keep the page in its original order while sections fill in, so the
+    page takes about as long as the slowest chain instead of the sum of every round trip.
+    Only the main thread touches Streamlit; workers just do network I/O.
+    """
+    st.subheader("📌 **Live Networking Events**")
+    events_box = st.container()
+    events_status = events_box.empty()
+    events_status.caption("⏳ Searching for events...")
+
+    st.subheader("💡 **AI-Powered Networking Strategies**")
+    strategies_slot = st.empty()
+    strategies_slot.caption("⏳ Gathering strategies...")
+
+    st.subheader("📌 Career Networking Insights")
+    insights_slot = st.empty()
+    insights_slot.caption("⏳ Asking the AI mentor...")
+
+    event_query = f"{profession} networking events in {location} {datetime.today().year}"
+    with ThreadPoolExecutor(max_workers=NETWORKING_MAX_WORKERS) as pool:
+        events_future = pool.submit(fetch_google_search_results, event_query)
+        strategies_future = pool.submit(get_ai_networking_insights, profession, location, concern)
+        insights_future = pool.submit(get_networking_insights, profession, location, concern)
+        summary_slots = {}
+        pending = {events_future, strategies_future, insights_future}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future is events_future:
+                    events = future.result()
+                    if not events:
+                        events_status.warning("⚠ No upcoming events found.")
+                        continue
+                    events_status.empty()
+                    for event in events:
+                        summary_future = pool.submit(summarize_event_details, event["title"], event["link"])
+                        summary_slots[summary_future] = events_box.empty()
+                        summary_slots[summary_future].caption(f"⏳ {event['title']}")
+                        pending.add(summary_future)
+                elif future is strategies_future:
+                    strategies_slot.info(future.result())
+                elif future is insights_future:
+                    insights_slot.write(future.result())
+                else:
+                    summary_slots[future].markdown(future.result())
 
 # ✅ Streamlit UI for Networking Insights
 def networking_ui():
@@ -122,26 +191,7 @@ def networking_ui():
 
     if st.button("Find Networking Opportunities"):
         if profession and location:
-            st.subheader("📌 **Live Networking Events**")
-
-            # 🔹 Fetch event links
-            event_query = f"{profession} networking events in {location} {datetime.today().year}"
-            events = fetch_google_search_results(event_query)
-
-            if events:
-                for event in events:
-                    st.markdown(summarize_event_details(event["title"], event["link"]))
-            else:
-                st.warning("⚠ No upcoming events found.")
-
-            # 🔹 AI-Powered Networking Strategies
-            st.subheader("💡 **AI-Powered Networking Strategies**")
-            st.info(get_ai_networking_insights(profession, location, concern))
-
-            # 🔹 Career Networking Insights (from Mistral)
-            st.subheader("📌 Career Networking Insights")
-            st.write(get_networking_insights(profession, location, concern))
-
+            render_networking_results(profession, location, concern)
         else:
             st.warning("⚠ Please enter both your profession and location!")
 
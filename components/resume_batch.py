@@ -0,0 +1,195 @@
+"""
+Bulk resume analysis for career centres.
+
+Walks a directory of PDF/DOCX resumes and runs each one through extract_text_from_resume()
+and fetch_resume_analysis() on a bounded worker pool. Mistral requests go through a
+token-bucket rate limiter set to the API quota, every finished file is recorded in a
+checkpoint file so an interrupted run picks up where it stopped, and the parsed ratings
+are appended to a JSONL file.
+
+Run from the project root:
+    python -m components.resume_batch resumes/ -o ratings.jsonl --rate 2
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from components.resume_upload import (
+    ANALYSIS_ERROR_FEEDBACK,
+    extract_text_from_resume,
+    fetch_resume_analysis,
+    resume_file_type,
+)
+from utils.helpers import RateLimiter
+from utils.llm_client import get_client
+from utils.resume_text import DOCX_MIME, PDF_MIME, content_hash
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+BATCH_WORKERS = int(os.getenv("RESUME_BATCH_WORKERS", "4"))
+# Mistral requests per second allowed by the API plan (each resume needs one or more)
+MISTRAL_REQUESTS_PER_SECOND = float(os.getenv("MISTRAL_REQUESTS_PER_SECOND", "1"))
+
+class ResumeFile:
+    """A resume on disk with the parts of Streamlit's UploadedFile that the extractors use."""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        with open(path, "rb") as f:
+            self._data = f.read()
+        self.type = PDF_MIME if self.name.lower().endswith(".pdf") else DOCX_MIME
+
+    def getvalue(self):
+        return self._data
+
+def find_resumes(directory):
+    """Yield resume paths under directory (recursively) in a stable order."""
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(RESUME_EXTENSIONS) and not name.startswith("~$"):
+                yield os.path.join(root, name)
+
+def load_checkpoint(path):
+    """Set of (relative path, sha256) pairs already analyzed by a previous run."""
+    done = set()
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    done.add((entry["file"], entry["sha256"]))
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # Typically the last line of an interrupted run; that file is simply analyzed again
+                    print(f"⚠ Skipping unreadable checkpoint line {line_number} in {path}", file=sys.stderr)
+    return done
+
+def end_partial_line(path):
+    """Terminate a line left unfinished by an interrupted run, so appended records start on their own line."""
+    if os.path.exists(path) and os.path.getsize(path):
+        with open(path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+def analyze_resume(path, relative_path):
+    """Extract and analyze one resume; returns the JSONL record (with "error" on failure)."""
+    start = time.perf_counter()
+    record = {"file": relative_path}
+    try:
+        resume = ResumeFile(path)
+        record["sha256"] = content_hash(resume.getvalue())
+        if resume_file_type(resume) not in (PDF_MIME, DOCX_MIME):
+            raise ValueError("unsupported file type")
+        text = extract_text_from_resume(resume)
+        if not text:
+            raise ValueError("no text could be extracted")
+        feedback, clarity, skills, impact, ats_compatible, improvements = fetch_resume_analysis(text)
+        if feedback == ANALYSIS_ERROR_FEEDBACK:
+            raise RuntimeError("resume analysis request failed")
+        record.update({
+            "clarity": clarity,
+            "skills": skills,
+            "impact": impact,
+            "ats_compatible": ats_compatible,
+            "feedback": feedback,
+            "improvements": improvements,
+        })
+    except Exception as e:  # One bad file must not stop the batch
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+def run_batch(directory, output_path, checkpoint_path=None, workers=BATCH_WORKERS, rate=MISTRAL_REQUESTS_PER_SECOND, burst=1):
+    """
+    Analyze every resume in directory not yet in the checkpoint; returns a summary dict.
+
+    At most `workers` resumes are in flight at once, so memory stays bounded however large
+    the directory is. Failed files are written with an "error" field but not checkpointed,
+    so the next run retries them.
+    """
+    checkpoint_path = checkpoint_path or f"{output_path}.checkpoint"
+    done = load_checkpoint(checkpoint_path)
+    client = get_client()
+    client.rate_limiter = RateLimiter(rate, burst)
+
+    end_partial_line(output_path)
+    end_partial_line(checkpoint_path)
+
+    start = time.perf_counter()
+    summary = {"analyzed": 0, "errors": 0, "skipped": 0}
+    with open(output_path, "a", encoding="utf-8") as out, open(checkpoint_path, "a", encoding="utf-8") as checkpoint, \
+            ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+
+        def drain(return_when):
+            nonlocal pending
+            finished, pending = wait(pending, return_when=return_when)
+            for future in finished:
+                record = future.result()
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+                if "error" in record:
+                    summary["errors"] += 1
+                    print(f"⚠ {record['file']}: {record['error']}", file=sys.stderr)
+                    continue
+                summary["analyzed"] += 1
+                checkpoint.write(json.dumps({"file": record["file"], "sha256": record["sha256"]}) + "\n")
+                checkpoint.flush()
+
+        for path in find_resumes(directory):
+            relative_path = os.path.relpath(path, directory)
+            if done:
+                with open(path, "rb") as f:
+                    if (relative_path, content_hash(f.read())) in done:
+                        summary["skipped"] += 1
+                        continue
+            pending.add(pool.submit(analyze_resume, path, relative_path))
+            if len(pending) >= workers * 2:
+                drain(FIRST_COMPLETED)
+        drain(ALL_COMPLETED)
+
+    elapsed = time.perf_counter() - start
+    processed = summary["analyzed"] + summary["errors"]
+    llm_stats = client.stats()
+    return {
+        **summary,
+        "seconds": round(elapsed, 3),
+        "resumes_per_minute": round(processed / elapsed * 60, 1) if elapsed and processed else None,
+        "error_rate": round(summary["errors"] / processed, 4) if processed else 0.0,
+        "llm_calls": sum(stats["calls"] for stats in llm_stats.values()),
+        "llm_errors": sum(stats["errors"] for stats in llm_stats.values()),
+        "llm_retries": sum(stats["retries"] for stats in llm_stats.values()),
+        "rate_limit_wait_seconds": round(client.rate_limiter.waited, 3),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze a directory of PDF/DOCX resumes.")
+    parser.add_argument("directory", help="Folder of resumes (searched recursively)")
+    parser.add_argument("-o", "--output", default="resume_ratings.jsonl", help="JSONL output path (appended to)")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS, help="Resumes processed concurrently")
+    parser.add_argument("--rate", type=float, default=MISTRAL_REQUESTS_PER_SECOND, help="Mistral requests per second")
+    parser.add_argument("--burst", type=int, default=1, help="Requests allowed back-to-back before rate limiting")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        print(f"❌ Error: Directory '{args.directory}' not found.", file=sys.stderr)
+        sys.exit(1)
+
+    summary = run_batch(args.directory, args.output, args.checkpoint, args.workers, args.rate, args.burst)
+    print(
+        f"✅ Analyzed {summary['analyzed']} resumes ({summary['errors']} errors, {summary['skipped']} already done) "
+        f"in {summary['seconds']}s — {summary['resumes_per_minute']} resumes/min, error rate {summary['error_rate']:.1%}\n"
+        f"   Mistral: {summary['llm_calls']} calls, {summary['llm_errors']} errors, {summary['llm_retries']} retries, "
+        f"{summary['rate_limit_wait_seconds']}s waiting on the rate limit",
+        file=sys.stderr,
+    )
+
+if __name__ == "__main__":
+    main()
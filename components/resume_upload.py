@@ -1,24 +1,29 @@
 
 import re
 import json
-import requests
 import streamlit as st
-import pdfplumber
-import docx
+from concurrent.futures import ThreadPoolExecutor
 import webbrowser
 import os
 from dotenv import load_dotenv
+from utils.llm_client import LLMError, chat_completion
+from utils.helpers import TTLCache
+from utils.resume_text import DOCX_MIME, PDF_MIME, content_hash, extract_resume, extraction_complete
+from utils.tokens import compact_text, count_tokens, truncate_to_tokens
 
 # Load environment variables
 load_dotenv()
 
 # 🔑 API Keys
-MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 SEARCH_ENGINE_ID = os.getenv("SEARCH_ENGINE_ID")
-MISTRAL_API_URL = os.getenv("MISTRAL_API_URL")
 GOOGLE_SEARCH_URL = os.getenv("GOOGLE_SEARCH_URL")
 
+# 🗄 Analyses keyed by resume content hash, shared by all sessions in this process
+ANALYSIS_CACHE_TTL = 24 * 60 * 60
+_analysis_cache = TTLCache(ttl=ANALYSIS_CACHE_TTL, max_entries=256)
+ANALYSIS_ERROR_FEEDBACK = "⚠ Error retrieving feedback."
+
 # 📌 Resume Analyzer Websites
 RESUME_ANALYZERS = {
     "📝 Resumeworded": "https://resumeworded.com/",
@@ -28,70 +33,222 @@ RESUME_ANALYZERS = {
 }
 
 # 📂 Extract Resume Text
+def resume_file_type(uploaded_file):
+    """MIME type of an upload, falling back to the extension (browsers disagree on DOCX types)."""
+    name = getattr(uploaded_file, "name", "").lower()
+    if uploaded_file.type == PDF_MIME or name.endswith(".pdf"):
+        return PDF_MIME
+    if uploaded_file.type == DOCX_MIME or name.endswith(".docx"):
+        return DOCX_MIME
+    return uploaded_file.type
+
+def extract_resume_details(uploaded_file):
+    """Extraction result (text, per-page timings, cache flag) for an uploaded PDF or DOCX."""
+    return extract_resume(uploaded_file.getvalue(), resume_file_type(uploaded_file))
+
 def extract_text_from_resume(uploaded_file):
     """Extracts text from a PDF or DOCX resume."""
-    text = ""
-    if uploaded_file.type == "application/pdf":
-        with pdfplumber.open(uploaded_file) as pdf:
-            text = "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()])
-    elif uploaded_file.type == "application/vnd.openxmlformat":
-        doc = docx.Document(uploaded_file)
-        text = "\n".join([para.text for para in doc.paragraph])
-    return text.strip()
+    return extract_resume_details(uploaded_file)["text"]
+
+def format_extraction_timings(extraction):
+    """One-line summary of per-page extraction time for the UI."""
+    if extraction["cached"]:
+        return "⏱ Text extraction: served from cache"
+    failed = set(extraction.get("failed_pages", ()))
+    pages = ", ".join(
+        f"p{i}: {seconds:.2f}s" if seconds is not None else f"p{i}: {'failed' if i in failed else 'timed out'}"
+        for i, seconds in enumerate(extraction["page_seconds"], start=1)
+    )
+    note = f" (first {extraction['pages_extracted']} of {extraction['pages']} pages)" if extraction["truncated"] else ""
+    return f"⏱ Text extraction{note} — {pages}"
+
+# 🧮 Token budgets for resume analysis (estimates from utils.tokens.count_tokens)
+RESUME_REQUEST_TOKEN_BUDGET = 6000  # Hard cap on the prompt of any single request
+RESUME_SINGLE_PASS_TOKENS = 4000  # Resumes up to this size are analyzed in one call
+RESUME_CHUNK_TOKENS = 1500
+RESUME_MAX_CHUNKS = 8
+RESUME_MAP_WORKERS = 4
+
+SECTION_HEADINGS = {
+    "summary", "profile", "professional summary", "objective", "experience", "work experience",
+    "professional experience", "employment", "employment history", "education", "skills",
+    "technical skills", "projects", "certifications", "certificates", "awards", "achievements",
+    "publications", "languages", "volunteering", "volunteer experience", "interests", "references",
+}
+
+SCORING_INSTRUCTIONS = """
+You are an expert resume reviewer. Rate the resume and reply with a JSON object only, using exactly these keys:
+- "clarity": integer 1-10 (formatting, readability, and section organization)
+- "skills": integer 1-10 (do listed skills match job market needs?)
+- "impact": integer 1-10 (how strong is this resume for recruiters?)
+- "ats_compatible": true or false (is this resume ATS-friendly?)
+- "feedback": short overall assessment (3-5 sentences)
+- "improvements": list of key improvement suggestions
+"""
+
+CHUNK_INSTRUCTIONS = """
+You are reviewing one part of a longer resume. Reply with a JSON object only, using exactly these keys:
+- "sections": the resume sections covered
+- "summary": the key facts (roles, skills, achievements, formatting) in under 80 words
+- "strengths": list of short strengths
+- "issues": list of short problems or gaps
+"""
+
+def is_section_heading(line):
+    stripped = line.strip().rstrip(":").strip()
+    if not stripped or len(stripped) > 40:
+        return False
+    return stripped.lower() in SECTION_HEADINGS or (stripped.isupper() and len(stripped.split()) <= 4)
+
+def split_into_chunks(text, chunk_tokens=RESUME_CHUNK_TOKENS):
+    """Group whole resume sections into chunks of at most chunk_tokens, splitting oversized sections by line."""
+    sections, current = [], []
+    for line in text.splitlines():
+        if is_section_heading(line) and current:
+            sections.append("\n".join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append("\n".join(current))
+
+    chunks, chunk = [], ""
+    for section in sections:
+        pieces = [section] if count_tokens(section) <= chunk_tokens else section.splitlines()
+        for piece in pieces:
+            piece = truncate_to_tokens(piece, chunk_tokens)
+            candidate = f"{chunk}\n{piece}" if chunk else piece
+            if count_tokens(candidate) <= chunk_tokens:
+                chunk = candidate
+            else:
+                chunks.append(chunk)
+                chunk = piece
+    if chunk:
+        chunks.append(chunk)
+    return chunks[:RESUME_MAX_CHUNKS]
+
+def budgeted_messages(instructions, content):
+    """System + user messages whose total estimated size fits RESUME_REQUEST_TOKEN_BUDGET."""
+    remaining = RESUME_REQUEST_TOKEN_BUDGET - count_tokens(instructions)
+    return [
+        {"role": "system", "content": instructions},
+        {"role": "user", "content": truncate_to_tokens(content, remaining)},
+    ]
+
+def parse_json_reply(content):
+    """Parse a JSON object reply, tolerating code fences or text around the object."""
+    try:
+        return json.loads(content)
+    except ValueError:
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        if not match:
+            raise
+        return json.loads(match.group(0))
+
+def analysis_from_json(data):
+    """Map the scoring JSON onto (feedback, clarity, skills, impact, ats_compatible, improvements)."""
+    def rating(key):
+        try:
+            return min(max(int(data.get(key)), 1), 10)
+        except (TypeError, ValueError):
+            return None
+
+    ats = data.get("ats_compatible")
+    ats_compatible = "N/A" if ats is None else ("Yes" if ats is True or str(ats).lower() in ("yes", "true") else "No")
+    improvements = data.get("improvements") or []
+    if isinstance(improvements, str):
+        improvements = [improvements]
+    improvements_text = "\n".join(f"- {item}" for item in improvements) or "No major improvements needed."
+    feedback = data.get("feedback") or "No feedback available."
+    return feedback, rating("clarity"), rating("skills"), rating("impact"), ats_compatible, improvements_text
+
+def summarize_resume_chunks(chunks):
+    """Map step: analyze every chunk concurrently; returns their JSON notes in resume order."""
+    def analyze(chunk):
+        reply = chat_completion(
+            budgeted_messages(CHUNK_INSTRUCTIONS, chunk),
+            name="resume.analysis.chunk",
+            temperature=0.2,
+            max_tokens=300,
+            response_format={"type": "json_object"},
+        )
+        try:
+            return parse_json_reply(reply)
+        except ValueError:
+            return {"summary": reply}
+
+    with ThreadPoolExecutor(max_workers=RESUME_MAP_WORKERS) as pool:
+        return list(pool.map(analyze, chunks))
 
 # 🔍 AI-Based Resume Analysis
 def fetch_resume_analysis(text):
-    """Analyzes resume and provides AI feedback using Mistral AI."""
-    prompt = f"""
-    Analyze the following resume and provide structured feedback with ratings:
-
-    1️⃣ **Clarity & Structure (1-10):** Formatting, readability, and section organization.
-    2️⃣ **Skill Relevance (1-10):** Do listed skills match job market needs?
-    3️⃣ **Overall Impact (1-10):** How strong is this resume for recruiters?
-    4️⃣ **ATS Compatibility (Yes/No):** Is this resume ATS-friendly?
-    
-    Key improvement suggestions should be provided.
-
-    Resume Content:
-    {text}
-
-    **Response Format:**
-    - Clarity & Structure: X/10
-    - Skill Relevance: X/10
-    - Overall Impact: X/10
-    - ATS Compatibility: Yes/No
-    - Key Improvements:
-      - [Improvement 1]
-      - [Improvement 2]
     """
+    Analyzes resume and provides AI feedback using Mistral AI.
 
-    headers = {"Authorization": f"Bearer {MISTRAL_API_KEY}", "Content-Type": "application/json"}
-    payload = {"model": "mistral-medium", "messages": [{"role": "system", "content": prompt}], "temperature": 0.7}
+    The text is compacted first. Resumes within RESUME_SINGLE_PASS_TOKENS are scored in one
+    call; longer ones are split into section-aware chunks that are summarized concurrently
+    and then scored in a final call over the notes. Every prompt is capped at
+    RESUME_REQUEST_TOKEN_BUDGET and ratings come back as JSON.
+    """
+    text = compact_text(text)
 
     try:
-        response = requests.post(MISTRAL_API_URL, headers=headers, data=json.dumps(payload))
-        response.raise_for_status()
-        feedback = response.json().get("choices", [{}])[0].get("message", {}).get("content", "No feedback available.")
-
-        # Extract structured ratings
-        clarity_match = re.search(r"Clarity & Structure: (\d+)/10", feedback)
-        skills_match = re.search(r"Skill Relevance: (\d+)/10", feedback)
-        impact_match = re.search(r"Overall Impact: (\d+)/10", feedback)
-        ats_match = re.search(r"ATS Compatibility: (Yes|No)", feedback)
-
-        clarity_rating = int(clarity_match.group(1)) if clarity_match else None
-        skills_rating = int(skills_match.group(1)) if skills_match else None
-        impact_rating = int(impact_match.group(1)) if impact_match else None
-        ats_compatible = ats_match.group(1) if ats_match else "N/A"
-
-        # Extract improvement suggestions
-        improvements_match = re.search(r"Key Improvements:\n(.*)", feedback, re.DOTALL)
-        improvements = improvements_match.group(1).strip() if improvements_match else "No major improvements needed."
-
-        return feedback, clarity_rating, skills_rating, impact_rating, ats_compatible, improvements
-    except requests.exceptions.RequestException as e:
+        if count_tokens(text) <= RESUME_SINGLE_PASS_TOKENS:
+            content = f"Resume Content:\n{text}"
+        else:
+            notes = summarize_resume_chunks(split_into_chunks(text))
+            content = (
+                "The resume was too long to review in one pass. These are notes on each part, in order:\n"
+                + json.dumps(notes, ensure_ascii=False, indent=1)
+            )
+
+        reply = chat_completion(
+            budgeted_messages(SCORING_INSTRUCTIONS, content),
+            name="resume.analysis",
+            max_tokens=800,
+            response_format={"type": "json_object"},
+        )
+        try:
+            return analysis_from_json(parse_json_reply(reply))
+        except ValueError:
+            return reply, None, None, None, "N/A", "No major improvements needed."
+    except LLMError as e:
         st.error(f"⚠ Error analyzing resume: {e}")
-        return "⚠ Error retrieving feedback.", None, None, None, "N/A", ""
+        return ANALYSIS_ERROR_FEEDBACK, None, None, None, "N/A", ""
+
+# 🗄 Memoized extraction & analysis (reruns from any button click cost no parsing or API calls)
+def get_resume_extraction(resume_key, uploaded_file):
+    """
+    Extraction for this upload, remembered in the session under its content hash. Incomplete
+    extractions (pages timed out or crashed) are not remembered so the next rerun retries them.
+    """
+    extractions = st.session_state.setdefault("resume_extractions", {})
+    if resume_key in extractions:
+        return extractions[resume_key]
+    extraction = extract_resume_details(uploaded_file)
+    if extraction_complete(extraction):
+        extractions[resume_key] = extraction
+    return extraction
+
+def get_resume_analysis(resume_key, resume_text, cacheable=True):
+    """
+    (feedback, ratings, ATS flag, improvements) for a resume, looked up in the session first,
+    then in the process-wide cache; Mistral is only called on a miss. Failed analyses, and
+    analyses of text from an incomplete extraction (cacheable=False), are not cached so the
+    next rerun retries them.
+    """
+    analyses = st.session_state.setdefault("resume_analyses", {})
+    if resume_key in analyses:
+        return analyses[resume_key]
+
+    analysis = _analysis_cache.get(resume_key)
+    if analysis is None:
+        with st.spinner("Analyzing your resume..."):
+            analysis = fetch_resume_analysis(resume_text)
+        if analysis[0] == ANALYSIS_ERROR_FEEDBACK or not cacheable:
+            return analysis
+        _analysis_cache.set(resume_key, analysis)
+    analyses[resume_key] = analysis
+    return analysis
 
 # 📌 Streamlit UI - Resume Analysis
 def resume_upload_ui():
@@ -103,13 +260,17 @@ def resume_upload_ui():
         st.success("✅ Resume uploaded successfully!")
 
         # 📂 Extract text for analysis
-        resume_text = extract_text_from_resume(uploaded_file)
+        resume_key = content_hash(uploaded_file.getvalue())
+        extraction = get_resume_extraction(resume_key, uploaded_file)
+        resume_text = extraction["text"]
+        st.caption(format_extraction_timings(extraction))
 
         # 🔍 AI-Based Resume Analysis
         with st.container():
             st.subheader("🔍 **AI-Based Resume Feedback**")
-            with st.spinner("Analyzing your resume..."):
-                feedback, clarity_rating, skills_rating, impact_rating, ats_compatible, improvements = fetch_resume_analysis(resume)
+            feedback, clarity_rating, skills_rating, impact_rating, ats_compatible, improvements = get_resume_analysis(
+                resume_key, resume_text, cacheable=extraction_complete(extraction)
+            )
             st.write(feedback)
 
             # 🎭 **Single** Resume Rating with Color Coding
@@ -1,41 +1,124 @@
-
 import streamlit as st
 import requests
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from utils.helpers import TTLCache
+from utils.metrics import span
 
 # Load environment variables
 load_dotenv()
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+YOUTUBE_SEARCH_URL = os.getenv("YOUTUBE_SEARCH_URL") or "https://www.googleapis.com/youtube/v3/search"
+
+# 🗄 Shared across all sessions in this process, so reruns and "Play" clicks cost no API quota
+RESULTS_PER_PAGE = 5
+SEARCH_CACHE_TTL = 60 * 60
+THUMBNAIL_CACHE_TTL = 24 * 60 * 60
+REQUEST_TIMEOUT = 10
+_search_cache = TTLCache(ttl=SEARCH_CACHE_TTL, max_entries=1024)
+_thumbnail_cache = TTLCache(ttl=THUMBNAIL_CACHE_TTL, max_entries=1024)
+_session = requests.Session()
+_prefetch_pool = ThreadPoolExecutor(max_workers=2)
+
+def _fetch_page(query, page_token):
+    params = {
+        "part": "snippet",
+        "q": query,
+        "type": "video",
+        "maxResults": RESULTS_PER_PAGE,
+        "key": YOUTUBE_API_KEY,
+    }
+    if page_token:
+        params["pageToken"] = page_token
+    with span("youtube.search") as search_span:
+        response = _session.get(YOUTUBE_SEARCH_URL, params=params, timeout=REQUEST_TIMEOUT)
+        search_span.add_bytes(len(response.content))
+        response.raise_for_status()
+        data = response.json()
+    return data.get("items", []), data.get("nextPageToken")
+
+def search_youtube(query, page_token=""):
+    """Return (videos, next_page_token) for one page of results, cached and coalesced across sessions."""
+    normalized = " ".join(query.lower().split())
+    return _search_cache.get_or_compute((normalized, page_token), lambda: _fetch_page(normalized, page_token))
+
+def get_thumbnail(url):
+    """Thumbnail image bytes, downloaded once and then served from memory."""
+    def download():
+        with span("youtube.thumbnail") as thumbnail_span:
+            response = _session.get(url, timeout=REQUEST_TIMEOUT)
+            thumbnail_span.add_bytes(len(response.content))
+            response.raise_for_status()
+            return response.content
+    return _thumbnail_cache.get_or_compute(url, download)
+
+def prefetch_page(query, page_token):
+    """Warm the caches for the next page (results and thumbnails) in the background."""
+    try:
+        videos, _ = search_youtube(query, page_token)
+        for video in videos:
+            get_thumbnail(video["snippet"]["thumbnails"]["medium"]["url"])
+    except requests.exceptions.RequestException:
+        pass  # The page will simply be fetched on demand
 
 def youtube_search_ui():
     st.title("🎥 YouTube Career Video Explorer")
     query = st.text_input("🔎 Search YouTube for career help:", placeholder="e.g., career in data science")
 
     if query:
-        url = f"https://www.googleapis.com/youtube/v3/search?part=snippet&q={query}&type=video&maxResults=5&key={YOUTUBE_API_KEY}"
-        response = requests.get(url)
-
-        if response.status_code == 200:
-            videos = response.json().get("items", [])
-            if videos:
-                # Display first video large
-                selected_video_id = st.session_state.get("selected_video_id", videos[0]["id"]["videoId"])
-                st.video(f"https://www.youtube.com/watch?v={selected_video_id}")
-
-                # Thumbnails horizontally
-                cols = st.columns(len(videos))
-                for i, video in enumerate(videos):
-                    vid_id = video["id"]["videoId"]
-                    title = video["snippet"]["title"]
-                    thumb_url = video["snippet"]["thumbnails"]["medium"]["url"]
-                    with cols[i]:
+        # New query: start again from the first page
+        if st.session_state.get("yt_query") != query:
+            st.session_state["yt_query"] = query
+            st.session_state["yt_page_tokens"] = [""]
+            st.session_state["yt_page"] = 0
+            st.session_state.pop("selected_video_id", None)
+        page = st.session_state["yt_page"]
+        page_tokens = st.session_state["yt_page_tokens"]
+
+        try:
+            videos, next_page_token = search_youtube(query, page_tokens[page])
+        except requests.exceptions.RequestException:
+            st.error("Failed to fetch videos from YouTube.")
+            return
+
+        if videos:
+            # Display first video large
+            selected_video_id = st.session_state.get("selected_video_id", videos[0]["id"]["videoId"])
+            st.video(f"https://www.youtube.com/watch?v={selected_video_id}")
+
+            # Thumbnails horizontally
+            cols = st.columns(len(videos))
+            for i, video in enumerate(videos):
+                vid_id = video["id"]["videoId"]
+                title = video["snippet"]["title"]
+                thumb_url = video["snippet"]["thumbnails"]["medium"]["url"]
+                with cols[i]:
+                    try:
+                        st.image(get_thumbnail(thumb_url), use_column_width=True)
+                    except requests.exceptions.RequestException:
                         st.image(thumb_url, use_column_width=True)
-                        st.caption(title)
-                        if st.button(f"▶️ Play {i+1}", key=f"play_{i}"):
-                            st.session_state["selected_video_id"] = vid_id
-                            st.rerun()
-            else:
-                st.warning("No videos found.")
+                    st.caption(title)
+                    if st.button(f"▶️ Play {i+1}", key=f"play_{page}_{i}"):
+                        st.session_state["selected_video_id"] = vid_id
+                        st.rerun()
+
+            # Pagination
+            prev_col, page_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                if page > 0 and st.button("⬅️ Previous"):
+                    st.session_state["yt_page"] = page - 1
+                    st.rerun()
+            with page_col:
+                st.caption(f"Page {page + 1}")
+            with next_col:
+                if next_page_token and st.button("Next ➡️"):
+                    if len(page_tokens) == page + 1:
+                        page_tokens.append(next_page_token)
+                    st.session_state["yt_page"] = page + 1
+                    st.rerun()
+
+            if next_page_token:
+                _prefetch_pool.submit(prefetch_page, query, next_page_token)
         else:
-            st.error("Failed to fetch videos from YouTube.")
+            st.warning("No videos found.")
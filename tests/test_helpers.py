@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from utils.helpers import percentile_ms, rss_mb
+
+@pytest.mark.parametrize("q", [0.0, 0.5, 0.95, 0.99, 1.0])
+def test_percentile_ms_matches_numpy(q):
+    seconds = [0.012, 0.003, 0.250, 0.041, 0.007, 0.090, 0.018]
+    assert percentile_ms(seconds, q) == pytest.approx(np.percentile(seconds, q * 100) * 1000)
+
+def test_percentile_ms_edge_cases():
+    assert percentile_ms([], 0.5) is None
+    assert percentile_ms([0.02], 0.99) == pytest.approx(20.0)
+
+def test_peak_rss_is_at_least_current_rss():
+    current, peak = rss_mb(), rss_mb(peak=True)
+    if current is not None and peak is not None:
+        assert peak >= current * 0.99
@@ -0,0 +1,41 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from utils.llm_client import LLMClient
+
+NON_ASCII_TEXT = "Café résumé — naïve 日本語"
+
+class EventStreamHandler(BaseHTTPRequestHandler):
+    """Streams NON_ASCII_TEXT in small deltas, with no charset in the Content-Type (like the real API)."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b""
+        for i in range(0, len(NON_ASCII_TEXT), 3):
+            chunk = {"choices": [{"index": 0, "delta": {"content": NON_ASCII_TEXT[i:i + 3]}}]}
+            body += f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8")
+        body += b"data: [DONE]\n\n"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stream_url():
+    server = HTTPServer(("127.0.0.1", 0), EventStreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    server.shutdown()
+    server.server_close()
+
+def test_stream_decodes_non_ascii_as_utf8(stream_url):
+    client = LLMClient(api_url=stream_url, api_key="test", max_retries=0)
+    deltas = list(client.stream([{"role": "user", "content": "hi"}], name="test"))
+    assert "".join(deltas) == NON_ASCII_TEXT
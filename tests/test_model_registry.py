@@ -0,0 +1,48 @@
+import os
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import CountVectorizer
+
+from training.predict import ForestEngine, ModelRegistry, current_mapped_version
+from training.train import export_mapped_artifacts
+
+def train_small_model(tmp_path, seed):
+    texts = ["python sql", "java spring", "python pandas", "excel sales", "java kotlin", "sales crm"]
+    vectorizer = CountVectorizer()
+    X = vectorizer.fit_transform(texts)
+    model = RandomForestClassifier(n_estimators=5, random_state=seed).fit(X, [0, 1, 0, 2, 1, 2])
+    model_path, vectorizer_path = str(tmp_path / "model.pkl"), str(tmp_path / "vectorizer.pkl")
+    joblib.dump(vectorizer, vectorizer_path)
+    joblib.dump(model, model_path)
+    return model, vectorizer, X.shape[1], model_path, vectorizer_path
+
+def test_exports_in_the_same_second_get_distinct_versions(tmp_path):
+    model, vectorizer, n_features, model_path, vectorizer_path = train_small_model(tmp_path, seed=0)
+    mapped_path = str(tmp_path / "mapped")
+    export_mapped_artifacts(model, vectorizer, n_features, mapped_path, model_path, vectorizer_path)
+    first = current_mapped_version(mapped_path)
+    export_mapped_artifacts(model, vectorizer, n_features, mapped_path, model_path, vectorizer_path)
+    assert current_mapped_version(mapped_path) != first
+    assert os.path.isdir(first)  # The previous version is kept for readers that still map it
+
+def test_registry_only_serves_an_export_built_from_the_current_pickles(tmp_path):
+    model, vectorizer, n_features, model_path, vectorizer_path = train_small_model(tmp_path, seed=0)
+    mapped_path = str(tmp_path / "mapped")
+    export_mapped_artifacts(model, vectorizer, n_features, mapped_path, model_path, vectorizer_path)
+    registry = ModelRegistry(model_path, vectorizer_path, str(tmp_path / "forest_arrays.npz"), mapped_path, use_mapped=True)
+
+    predictor, _ = registry.get_predictor()
+    assert isinstance(predictor, ForestEngine)
+    sklearn_model, _ = registry.get()
+    assert np.array_equal(sklearn_model.classes_, model.classes_)
+
+    # A newer model pickle without a matching export: serve the pickles, not the stale arrays
+    newer_model = train_small_model(tmp_path, seed=1)[0]
+    joblib.dump(newer_model, model_path)
+    stat = os.stat(model_path)
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    predictor, _ = registry.get_predictor()
+    assert isinstance(predictor, RandomForestClassifier)
+    assert registry.stats()["format"] == "pickle"
@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+
+from training import preprocess
+
+@pytest.fixture
+def output_paths(tmp_path, monkeypatch):
+    csv_path = tmp_path / "processed.csv"
+    monkeypatch.setattr(preprocess, "output_path", str(csv_path))
+    monkeypatch.setattr(preprocess, "parquet_output_path", str(tmp_path / "processed.parquet"))
+    return csv_path
+
+def test_duplicates_across_chunks_with_different_inferred_dtypes(tmp_path, output_paths):
+    raw = tmp_path / "raw.csv"
+    # The second chunk has a blank experience, which would make pandas read it as float (5.0)
+    raw.write_text("Job Title,Skills,Experience\nA,x y,5\nB,z,7\nA,x y,5\nC,w,\n")
+    summary = preprocess.preprocess(str(raw), "csv", chunk_size=2)
+    df = pd.read_csv(output_paths)
+    assert summary["rows_out"] == 3
+    assert df["job title"].tolist() == ["A", "B", "C"]
+
+def test_failed_run_keeps_previous_output(tmp_path, output_paths):
+    output_paths.write_text("job title,skills\nOld,kept\n")
+    raw = tmp_path / "raw.csv"
+    raw.write_text("Job Title,Skills\nA,x\nB,y\nC,\"unterminated\n")
+    with pytest.raises(Exception):
+        preprocess.preprocess(str(raw), "csv", chunk_size=1)
+    assert output_paths.read_text() == "job title,skills\nOld,kept\n"
+    assert not (tmp_path / "processed.csv.tmp").exists()
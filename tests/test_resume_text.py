@@ -0,0 +1,29 @@
+from utils import resume_text
+
+def fake_extract(timed_out_pages):
+    calls = []
+
+    def extract(data, file_type):
+        calls.append(data)
+        return {
+            "text": "partial" if timed_out_pages else "full", "pages": 2, "pages_extracted": 2,
+            "page_seconds": [0.1, None if timed_out_pages else 0.1], "timed_out_pages": timed_out_pages,
+            "failed_pages": [], "truncated": False,
+        }
+    return extract, calls
+
+def test_incomplete_extraction_is_not_cached(monkeypatch):
+    extract, calls = fake_extract(timed_out_pages=[2])
+    monkeypatch.setattr(resume_text, "_extract", extract)
+    data = b"incomplete resume bytes"
+    assert resume_text.extract_resume(data, resume_text.PDF_MIME)["cached"] is False
+    assert resume_text.extract_resume(data, resume_text.PDF_MIME)["cached"] is False
+    assert len(calls) == 2
+
+def test_complete_extraction_is_cached(monkeypatch):
+    extract, calls = fake_extract(timed_out_pages=[])
+    monkeypatch.setattr(resume_text, "_extract", extract)
+    data = b"complete resume bytes"
+    resume_text.extract_resume(data, resume_text.PDF_MIME)
+    assert resume_text.extract_resume(data, resume_text.PDF_MIME)["cached"] is True
+    assert len(calls) == 1
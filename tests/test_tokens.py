@@ -0,0 +1,40 @@
+from utils.resume_text import PAGE_BREAK
+from utils.tokens import compact_text, count_tokens, truncate_to_tokens
+
+def pages(*bodies):
+    return f"\n{PAGE_BREAK}\n".join(bodies)
+
+def test_compact_text_drops_running_header_and_footer():
+    page = "Jane Doe — Resume\n{body}\nPage {n} of 3\nConfidential"
+    text = pages(*(page.format(body=f"Worked on project {n}.", n=n) for n in (1, 2, 3)))
+    compacted = compact_text(text)
+    assert "Jane Doe — Resume" not in compacted
+    assert "Confidential" not in compacted
+    assert "Page 2 of 3" not in compacted
+    assert all(f"Worked on project {n}." in compacted for n in (1, 2, 3))
+
+def test_compact_text_keeps_lines_repeated_within_one_page():
+    text = "\n".join([
+        "EXPERIENCE",
+        "Data Analyst", "Remote", "Python, SQL", "Built dashboards.",
+        "Data Analyst", "Remote", "Python, SQL", "Automated reports.",
+        "Data Analyst", "Remote", "Python, SQL", "Cleaned data.",
+        "EDUCATION",
+    ])
+    compacted = compact_text(text)
+    assert compacted.count("Data Analyst") == 3
+    assert compacted.count("Remote") == 3
+    assert compacted.count("Python, SQL") == 3
+
+def test_compact_text_keeps_repeated_body_lines_across_pages():
+    text = pages(
+        "Header\nSkills\nRemote\nPython\nJava\nFooter",
+        "Header\nRemote\nGo\nRust\nFooter",
+    )
+    compacted = compact_text(text)
+    assert "Header" not in compacted and "Footer" not in compacted
+    assert compacted.count("Remote") == 2
+
+def test_truncate_to_tokens_respects_budget():
+    text = "\n".join(f"line {i} with a few words" for i in range(200))
+    assert count_tokens(truncate_to_tokens(text, 50)) <= 50
@@ -0,0 +1,84 @@
+"""
+Batch career recommendations for whole cohorts.
+
+Reads candidate profiles from a JSONL or CSV file, scores them in chunks through
+predict_batch() and streams one JSON result per line, so memory stays bounded by the
+chunk size rather than the input size.
+
+Run from the project root:
+    python -m training.batch_predict candidates.jsonl -o recommendations.jsonl
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+from training.predict import predict_batch
+
+def read_profiles(path, skills_field):
+    """Yield (record_id, skills) pairs from a JSONL or CSV file without loading it whole."""
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            for line_no, row in enumerate(csv.DictReader(f), start=1):
+                yield row.get("id", line_no), row.get(skills_field) or ""
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                yield record.get("id", line_no), record.get(skills_field) or ""
+
+def run_batch(input_path, output_path, skills_field="skills", chunk_size=2048, top_k=1):
+    """Score every profile in input_path and write JSONL results; returns a summary dict."""
+    profiles = read_profiles(input_path, skills_field)
+    start = time.perf_counter()
+    rows = errors = 0
+    out = sys.stdout if output_path == "-" else open(output_path, "w", encoding="utf-8")
+    try:
+        while True:
+            chunk = list(islice(profiles, chunk_size))
+            if not chunk:
+                break
+            ids, skills = zip(*chunk)
+            for record_id, result in zip(ids, predict_batch(skills, chunk_size=chunk_size, k=top_k)):
+                out.write(json.dumps({"id": record_id, **result}, default=str) + "\n")
+                errors += "error" in result
+            rows += len(chunk)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a file of candidate skill profiles.")
+    parser.add_argument("input", help="JSONL or CSV file with one candidate per line/row")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output path (default: stdout)")
+    parser.add_argument("--skills-field", default="skills", help="Field/column holding comma-separated skills")
+    parser.add_argument("--chunk-size", type=int, default=2048, help="Profiles vectorized and scored per predict_proba call")
+    parser.add_argument("--top-k", type=int, default=1, help="Also list the next k-1 best jobs per profile")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ Error: File '{args.input}' not found.", file=sys.stderr)
+        sys.exit(1)
+
+    summary = run_batch(args.input, args.output, args.skills_field, args.chunk_size, args.top_k)
+    print(
+        f"✅ Scored {summary['rows']} profiles ({summary['errors']} errors) in {summary['seconds']}s "
+        f"— {summary['rows_per_second']} profiles/sec",
+        file=sys.stderr,
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Performance and accuracy benchmark suite for the prediction path.
+
+Measures cold-start model load, single-request latency of get_job_recommendation(), batch
+throughput, peak RSS, model artifact size and held-out accuracy (via evaluate.py), plus the
+compiled forest engine against scikit-learn and per-process RSS / PSS with 1 and 8 worker
+processes serving from the memory-mapped export versus the pickles. Requests use synthetic skill profiles drawn from
+the vectorizer's vocabulary. Results can be written as JSON and compared with a stored
+baseline; the process exits with status 1 when a metric regresses past the threshold.
+
+Run from the project root after training:
+    python -m training.benchmark --profiles 500 --output bench.json
+    python -m training.benchmark --baseline bench_baseline.json --threshold 0.15
+    python -m training.benchmark --save-baseline bench_baseline.json
+    python -m training.benchmark --workers 1 4 8 16
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from training.predict import MAPPED_MODEL_PATH, MODEL_REGISTRY, current_mapped_version, get_job_recommendation, predict_batch
+from utils.helpers import percentile_ms, rss_mb
+
+MODELS_DIR = "data/models"
+FALLBACK_SKILLS = ["python", "sql", "excel", "communication", "leadership", "java", "marketing", "sales",
+                   "design", "cloud", "aws", "statistics", "management", "accounting", "javascript", "react"]
+
+# Metric name -> True if higher is better; only these are compared with the baseline
+METRICS = {
+    "cold_import_seconds": False,
+    "cold_load_seconds": False,
+    "p50_ms": False,
+    "p99_ms": False,
+    "batch_rows_per_second": True,
+    "peak_rss_mb": False,
+    "artifact_bytes": False,
+    "accuracy": True,
+    "engine_p50_ms": False,
+    "pss_per_worker_mb": False,
+}
+
+COLD_START_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from training.predict import load_model, load_predictor
+imported = time.perf_counter()
+load_model()
+load_predictor()
+loaded = time.perf_counter()
+print(json.dumps({"import_seconds": imported - start, "load_seconds": loaded - imported}))
+"""
+
+# A serving worker: loads the predictor, scores the profiles it is sent, then idles until stdin closes
+WORKER_MEMORY_SCRIPT = """
+import json, sys
+from training.predict import load_predictor, score
+profiles = json.loads(sys.stdin.readline())
+model, vectorizer = load_predictor()
+for text in profiles:
+    score(model, vectorizer, [text])
+print("ready", flush=True)
+sys.stdin.read()
+"""
+
+def profile_vocabulary(vectorizer):
+    """
+    Terms to build synthetic profiles from: the vectorizer's vocabulary, or for vocabulary-free
+    vectorizers (hashing, trained with --profile compact --vectorizer hashing) the words of
+    the processed training data, falling back to FALLBACK_SKILLS.
+    """
+    steps = [step for _, step in vectorizer.steps] if hasattr(vectorizer, "steps") else [vectorizer]
+    for step in steps:
+        if getattr(step, "vocabulary_", None):
+            return sorted(step.vocabulary_)
+
+    from training.evaluate import load_dataset
+
+    try:
+        words = {word for text in load_dataset()["skills"].head(5000).astype(str) for word in text.split()}
+    except (FileNotFoundError, KeyError):
+        words = set()
+    return sorted(words) or FALLBACK_SKILLS
+
+def synthetic_profiles(vectorizer, n_profiles, skills_per_profile=8, seed=42):
+    """Random comma-separated skill strings drawn from the vectorizer's vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = profile_vocabulary(vectorizer)
+    return [", ".join(rng.sample(vocabulary, min(skills_per_profile, len(vocabulary)))) for _ in range(n_profiles)]
+
+def artifact_bytes(directory=MODELS_DIR):
+    """
+    Total size of the serving artifacts on disk (of the mapped export, only the current
+    version); hard-linked files such as the export's model pickle are counted once.
+    """
+    current = current_mapped_version(MAPPED_MODEL_PATH)
+    sizes = {}
+    for root, dirs, files in os.walk(directory):
+        if os.path.normpath(root) == os.path.normpath(MAPPED_MODEL_PATH):
+            dirs[:] = [name for name in dirs if current and os.path.join(root, name) == current]
+        for name in files:
+            stat = os.stat(os.path.join(root, name))
+            sizes[stat.st_dev, stat.st_ino] = stat.st_size
+    return sum(sizes.values())
+
+def measure_cold_start():
+    """Import + first model load in a fresh interpreter, so nothing is cached in-process."""
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd() + os.pathsep + os.environ.get("PYTHONPATH", "")},
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def smaps_rollup_mb(pid):
+    """(RSS, PSS) of a process in MB from /proc/<pid>/smaps_rollup, or None where unavailable."""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if line.startswith(("Rss:", "Pss:")))
+    except OSError:
+        return None
+    return int(fields["Rss"].split()[0]) / 1024, int(fields["Pss"].split()[0]) / 1024
+
+def measure_worker_memory(profiles, n_workers, mapped):
+    """
+    Start n_workers fresh interpreters that load the predictor (MODEL_MMAP on or off) and
+    score `profiles`, then read every worker's RSS and PSS while all of them are alive.
+    PSS splits shared pages between the processes mapping them, so the total PSS is what
+    the workers really cost the host. Returns None where smaps_rollup is unavailable.
+    """
+    env = {**os.environ, "MODEL_MMAP": "1" if mapped else "0",
+           "PYTHONPATH": os.getcwd() + os.pathsep + os.environ.get("PYTHONPATH", "")}
+    workers = [
+        subprocess.Popen([sys.executable, "-c", WORKER_MEMORY_SCRIPT], stdin=subprocess.PIPE,
+                         stdout=subprocess.PIPE, text=True, env=env)
+        for _ in range(n_workers)
+    ]
+    try:
+        for worker in workers:
+            worker.stdin.write(json.dumps(profiles) + "\n")
+            worker.stdin.flush()
+        for worker in workers:
+            for line in worker.stdout:
+                if line.strip() == "ready":
+                    break
+            else:
+                raise RuntimeError("A benchmark worker exited before loading the model.")
+        samples = [smaps_rollup_mb(worker.pid) for worker in workers]
+    finally:
+        for worker in workers:
+            worker.stdin.close()
+            worker.wait()
+    if None in samples:
+        return None
+    rss, pss = zip(*samples)
+    return {
+        "format": "mapped" if mapped else "pickle",
+        "workers": n_workers,
+        "rss_per_worker_mb": sum(rss) / n_workers,
+        "pss_per_worker_mb": sum(pss) / n_workers,
+        "total_pss_mb": sum(pss),
+    }
+
+def time_calls(fn, inputs):
+    """Per-call latencies (seconds) of fn over inputs."""
+    latencies = []
+    for item in inputs:
+        start = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def benchmark_engine(vectorizer, profiles, tolerance=1e-6):
+    """Check engine/sklearn parity and compare their single-row predict_proba latency."""
+    model, _ = MODEL_REGISTRY.get()
+    engine, _ = MODEL_REGISTRY.get_predictor()
+    if engine is model:
+        return {"engine_available": False}
+
+    X = vectorizer.transform(profiles)
+    max_diff = float(np.abs(model.predict_proba(X) - engine.predict_proba(X)).max())
+    rows = [X[i] for i in range(X.shape[0])]
+    sklearn_latencies = time_calls(model.predict_proba, rows)
+    engine_latencies = time_calls(engine.predict_proba, rows)
+    return {
+        "engine_available": True,
+        "engine_max_abs_diff": max_diff,
+        "engine_within_tolerance": max_diff <= tolerance,
+        "sklearn_p50_ms": percentile_ms(sklearn_latencies, 0.5),
+        "engine_p50_ms": percentile_ms(engine_latencies, 0.5),
+        "engine_speedup_p50": float(np.median(sklearn_latencies) / np.median(engine_latencies)),
+    }
+
+def measure_accuracy():
+    """Held-out accuracy from evaluate.py, or None if the processed dataset is missing."""
+    from training.evaluate import evaluate_model, load_artifacts, load_dataset
+
+    try:
+        df = load_dataset()
+    except FileNotFoundError:
+        return None
+    return float(evaluate_model(*load_artifacts(), df)["accuracy"])
+
+def run_suite(n_profiles=500, skills_per_profile=8, batch_size=5000, with_accuracy=True, worker_counts=(1, 8)):
+    """Run every benchmark and return a flat dict of results."""
+    cold = measure_cold_start()
+    _, vectorizer = MODEL_REGISTRY.get()
+
+    profiles = synthetic_profiles(vectorizer, n_profiles, skills_per_profile)
+    get_job_recommendation(profiles[0])  # Warm the market data store
+    latencies = time_calls(get_job_recommendation, profiles)
+
+    batch = synthetic_profiles(vectorizer, batch_size, skills_per_profile, seed=7)
+    start = time.perf_counter()
+    for _ in predict_batch(batch):
+        pass
+    batch_seconds = time.perf_counter() - start
+
+    results = {
+        "profiles": n_profiles,
+        "skills_per_profile": skills_per_profile,
+        "cold_import_seconds": cold["import_seconds"],
+        "cold_load_seconds": cold["load_seconds"],
+        "p50_ms": percentile_ms(latencies, 0.5),
+        "p99_ms": percentile_ms(latencies, 0.99),
+        "batch_size": batch_size,
+        "batch_rows_per_second": batch_size / batch_seconds,
+        "artifact_bytes": artifact_bytes(),
+        "accuracy": measure_accuracy() if with_accuracy else None,
+    }
+    results.update(benchmark_engine(vectorizer, profiles))
+
+    # Memory-mapped export first (when train.py wrote one), then the pickles it replaces
+    formats = [True, False] if current_mapped_version(MAPPED_MODEL_PATH) else [False]
+    memory = [measure_worker_memory(profiles[:100], n, mapped) for mapped in formats for n in worker_counts]
+    results["worker_memory"] = [sample for sample in memory if sample is not None]
+    if results["worker_memory"]:
+        results["pss_per_worker_mb"] = results["worker_memory"][len(worker_counts) - 1]["pss_per_worker_mb"]
+    results["peak_rss_mb"] = rss_mb(peak=True)  # Last, so it covers everything above
+    return results
+
+def compare_with_baseline(results, baseline, threshold):
+    """Return [(metric, baseline, current, change)] for metrics worse than baseline by > threshold."""
+    regressions = []
+    for metric, higher_is_better in METRICS.items():
+        current, previous = results.get(metric), baseline.get(metric)
+        if current is None or not previous:
+            continue
+        change = (current - previous) / previous
+        if (higher_is_better and change < -threshold) or (not higher_is_better and change > threshold):
+            regressions.append((metric, previous, current, change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the career prediction path.")
+    parser.add_argument("--profiles", type=int, default=500, help="Synthetic single requests to time")
+    parser.add_argument("--skills", type=int, default=8, help="Skills per synthetic profile")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Profiles scored for the throughput test")
+    parser.add_argument("--skip-accuracy", action="store_true", help="Skip evaluate.py (needs the processed dataset)")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a results JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative regression (0.10 = 10%%)")
+    parser.add_argument("--save-baseline", help="Store these results as the new baseline")
+    parser.add_argument("--workers", type=int, nargs="*", default=[1, 8],
+                        help="Worker process counts for the RSS / PSS measurement (none to skip it)")
+    args = parser.parse_args()
+
+    results = run_suite(args.profiles, args.skills, args.batch_size, not args.skip_accuracy, args.workers)
+
+    print("\n⏱ Prediction Benchmark")
+    print("=" * 40)
+    print(f"🧊 Cold start: import {results['cold_import_seconds']:.2f}s, model load {results['cold_load_seconds']:.2f}s")
+    print(f"⚡ get_job_recommendation p50/p99: {results['p50_ms']:.2f} / {results['p99_ms']:.2f} ms")
+    print(f"📦 Batch throughput: {results['batch_rows_per_second']:,.0f} profiles/sec")
+    if results["engine_available"]:
+        print(f"🚀 Engine p50 {results['engine_p50_ms']:.2f} ms vs scikit-learn {results['sklearn_p50_ms']:.2f} ms "
+              f"({results['engine_speedup_p50']:.1f}x, max |Δ proba| {results['engine_max_abs_diff']:.1e})")
+    if results["peak_rss_mb"] is not None:
+        print(f"🧠 Peak RSS: {results['peak_rss_mb']:.0f} MB")
+    print(f"💾 Artifacts: {results['artifact_bytes'] / 1e6:.1f} MB")
+    if results["worker_memory"]:
+        print(f"🧩 {'Format':<8}{'workers':>8}{'RSS/worker':>12}{'PSS/worker':>12}{'total PSS':>12}")
+        for sample in results["worker_memory"]:
+            print(f"   {sample['format']:<8}{sample['workers']:>8}{sample['rss_per_worker_mb']:>9.0f} MB"
+                  f"{sample['pss_per_worker_mb']:>9.0f} MB{sample['total_pss_mb']:>9.0f} MB")
+    if results["accuracy"] is not None:
+        print(f"🎯 Accuracy: {results['accuracy']:.4f}")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2)
+            print(f"📂 Results saved at: {path}")
+
+    failed = results["engine_available"] and not results["engine_within_tolerance"]
+    if failed:
+        print("❌ Compiled forest engine disagrees with scikit-learn!")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+        for metric, previous, current, change in regressions:
+            print(f"❌ Regression in {metric}: {previous:.4g} → {current:.4g} ({change:+.1%})")
+        if not regressions:
+            print(f"✅ No regressions beyond {args.threshold:.0%} against {args.baseline}")
+        failed = failed or bool(regressions)
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -3,75 +3,459 @@ def get_job_recommendation(skills_input):
     Given a comma-separated string of skills, return a dictionary with job recommendation and insights.
     """
     try:
-        model, vectorizer = load_model()
-        market_data = load_market_data()
-        skills_list = [s.strip().lower() for s in skills_input.split(",") if s.strip()]
-        if not skills_list:
+        skills_text = normalize_skills(skills_input)
+        if not skills_text:
             return {"error": "No skills provided."}
-        skills_vectorized = vectorizer.transform([" ".join(skills_list)])
-        predicted_job_id = model.predict(skills_vectorized)[0]
+        market_data = load_market_data()
         if "Job Id" not in market_data.columns or "Job Title" not in market_data.columns:
             return {"error": "Required columns missing in market data."}
-        job_row = market_data[market_data["Job Id"] == predicted_job_id]
-        if job_row.empty:
-            return {"error": "No matching job found for the prediction."}
-        predicted_job_title = job_row["Job Title"].values[0]
-        confidence = float(model.predict_proba(skills_vectorized).max() * 100)
-        # Market insights
-        market_insights_row = get_market_insights(predicted_job_title, market_data)
-        avg_salary = market_insights_row["Salary Range"] if market_insights_row is not None and "Salary Range" in market_insights_row else "N/A"
-        demand_level = market_insights_row["Demand Level"] if market_insights_row is not None and "Demand Level" in market_insights_row else "N/A"
-        market_insights_html = ""
-        if market_insights_row is not None:
-            for col in market_insights_row.index:
-                if col not in ["Job Title", "Salary Range", "Demand Level", "Job Id"]:
-                    market_insights_html += f"<b>{col}:</b> {market_insights_row[col]}<br>"
-        # Dummy skills improvement and alternative jobs (customize as needed)
-        skills_improvement = "Consider improving your communication, teamwork, and leadership skills."
-        alternative_jobs = "<ul><li>Data Analyst</li><li>Business Analyst</li></ul>" if predicted_job_title != "Data Analyst" else "<ul><li>Software Engineer</li><li>Product Manager</li></ul>"
-        return {
-            "job_title": predicted_job_title,
-            "confidence": f"{confidence:.1f}",
-            "avg_salary": avg_salary,
-            "demand_level": demand_level,
-            "market_insights": market_insights_html or "No additional insights available.",
-            "skills_improvement": skills_improvement,
-            "alternative_jobs": alternative_jobs
-        }
+        # One predict_proba pass gives the prediction and the alternatives
+        return format_recommendation(recommend_jobs(skills_text, k=TOP_K))
     except FileNotFoundError as e:
         return {"error": str(e)}
     except Exception as e:
         return {"error": f"Prediction failed: {str(e)}"}
+import bisect
+import json
 import os
-import pickle
+import sys
+import joblib
+import threading
+import time
+from collections.abc import Mapping
+import numpy as np
 import pandas as pd
 
+if not __package__:  # Run as `python training/predict.py`: make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.metrics import span
+
+# Number of ranked jobs returned per request (the top one plus alternatives)
+TOP_K = 4
+# Alternatives below this confidence (%) are noise: top-k always fills k slots, even with zero-probability jobs
+MIN_ALTERNATIVE_CONFIDENCE = 1.0
+
 # Paths to model and vectorizer
 MODEL_PATH = "data/models/career_recommendation_model.pkl"
 VECTORIZER_PATH = "data/models/vectorizer.pkl"
+FOREST_ARRAYS_PATH = "data/models/forest_arrays.npz"  # Older exports; train.py now writes MAPPED_MODEL_PATH
 MARKET_DATA_PATH = "data/market_data.csv"
 
+# 🗺 Memory-mapped serving artifacts: uncompressed .npy files opened with mmap_mode="r", so
+# every process on the host shares one copy in the page cache (set MODEL_MMAP=0 to disable)
+MAPPED_MODEL_PATH = "data/models/mapped"
+# Each export is a new version directory holding the arrays, the pickles it was built from and
+# its own MAPPED_MANIFEST (which records those pickles' fingerprints);
+# MAPPED_POINTER names the current version and is switched with os.replace, so files that
+# running processes have mapped are never renamed or overwritten (Windows forbids both)
+MAPPED_MANIFEST = "manifest.json"
+MAPPED_POINTER = "current.json"
+USE_MAPPED_MODEL = os.getenv("MODEL_MMAP", "1") != "0"
+
+def current_mapped_version(directory):
+    """Path of the version directory MAPPED_POINTER points at, or None if there is no export."""
+    try:
+        with open(os.path.join(directory, MAPPED_POINTER)) as f:
+            return os.path.join(directory, json.load(f)["version"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+def load_mapped_array(path):
+    """Open a .npy file read-only with mmap_mode, as a plain ndarray view (np.memmap adds per-operation overhead)."""
+    return np.load(path, mmap_mode="r").view(np.ndarray)
+
+class MappedVocabulary(Mapping):
+    """
+    Read-only term -> column mapping backed by two memory-mapped arrays (UTF-8 terms in sorted
+    order and their columns), used as CountVectorizer.vocabulary_ in place of a dict.
+
+    Lookups are a binary search, and the arrays are shared by every process instead of being
+    rebuilt as a dict in each one. It pickles as its directory, so loading the vectorizer
+    reopens the maps rather than copying the terms.
+    """
+
+    def __init__(self, directory, terms=None, columns=None):
+        self.directory = directory
+        if terms is None:
+            terms = load_mapped_array(os.path.join(directory, "vocabulary_terms.npy"))
+            columns = load_mapped_array(os.path.join(directory, "vocabulary_columns.npy"))
+        self.terms = terms
+        self.columns = columns
+
+    def __reduce__(self):
+        return MappedVocabulary, (self.directory,)
+
+    def __getitem__(self, term):
+        key = term.encode("utf-8")
+        i = bisect.bisect_left(self.terms, key)  # Cheaper than np.searchsorted for one scalar
+        if i < len(self.terms) and self.terms[i] == key:
+            return int(self.columns[i])
+        raise KeyError(term)
+
+    def __iter__(self):
+        return (term.decode("utf-8") for term in self.terms)
+
+    def __len__(self):
+        return len(self.terms)
+
+class ForestEngine:
+    """
+    Array-backed RandomForest inference, exported by train.py into MAPPED_MODEL_PATH (one
+    memory-mapped .npy file per array) or, by older versions, into FOREST_ARRAYS_PATH.
+
+    All trees live in flat structure-of-arrays form: `feature`, `threshold`, `children`
+    (left/right, leaves point to themselves) and CSR-style leaf class probabilities
+    (`leaf_ptr`, `leaf_class`, `leaf_prob`). A row is scored by advancing every tree one
+    level per step with NumPy gathers, reading only the row's nonzero features, which avoids
+    scikit-learn's per-call validation and threading overhead for single requests.
+    """
+
+    ARRAYS = ("feature", "threshold", "children", "leaf_ptr", "leaf_class", "leaf_prob", "roots", "classes")
+
+    def __init__(self, arrays, n_features, max_depth):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        self.n_features = int(n_features)
+        self.max_depth = int(max_depth)
+        self.n_trees = len(self.roots)
+        self.n_classes = len(self.classes)
+        self.classes_ = self.classes  # Same attribute name as the sklearn model
+        self.path = None  # Version directory, for engines loaded from a memory-mapped export
+
+    @classmethod
+    def load(cls, path):
+        """Load from an exported version directory (memory-mapped) or an older .npz file."""
+        if os.path.isdir(path):
+            with open(os.path.join(path, MAPPED_MANIFEST)) as f:
+                manifest = json.load(f)
+            arrays = {name: load_mapped_array(os.path.join(path, name + ".npy")) for name in cls.ARRAYS}
+            engine = cls(arrays, manifest["n_features"], manifest["max_depth"])
+            engine.path = path
+            return engine
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files}
+        return cls(arrays, arrays.pop("n_features"), arrays.pop("max_depth"))
+
+    def _row_proba(self, indices, values):
+        x = np.zeros(self.n_features, dtype=np.float32)
+        x[indices] = values
+        nodes = self.roots
+        for _ in range(self.max_depth):
+            go_left = x[self.feature[nodes]] <= self.threshold[nodes]
+            next_nodes = self.children[nodes, np.where(go_left, 0, 1)]
+            if np.array_equal(next_nodes, nodes):
+                break
+            nodes = next_nodes
+
+        # Gather the CSR leaf segments of every reached leaf and sum them per class
+        starts = self.leaf_ptr[nodes]
+        lengths = self.leaf_ptr[nodes + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return np.bincount(self.leaf_class[offsets], weights=self.leaf_prob[offsets], minlength=self.n_classes) / self.n_trees
+
+    def predict_proba(self, X):
+        """Class probabilities for a CSR matrix, matching RandomForestClassifier.predict_proba."""
+        X = X.tocsr()
+        return np.vstack([
+            self._row_proba(X.indices[X.indptr[i]:X.indptr[i + 1]], X.data[X.indptr[i]:X.indptr[i + 1]])
+            for i in range(X.shape[0])
+        ])
+
+class ModelRegistry:
+    """
+    Process-wide cache for the trained model and vectorizer.
+
+    The artifacts are loaded once and shared by every Streamlit session in the process.
+    Each lookup compares the files' (mtime, size) fingerprint with the loaded one, so a
+    retrained model is picked up on the next call without restarting the app. The exported
+    forest arrays are loaded alongside the model when present and not older than it.
+
+    With a memory-mapped export in mapped_path that was built from the current pickles (its
+    manifest records their fingerprints), the predictor and vectorizer come from it and the
+    export's copy of the model is only unpickled on the first get() (batch scoring), so
+    processes that only serve single requests never hold a private copy of the forest.
+    """
+
+    def __init__(self, model_path=MODEL_PATH, vectorizer_path=VECTORIZER_PATH, forest_path=FOREST_ARRAYS_PATH,
+                 mapped_path=MAPPED_MODEL_PATH, use_mapped=USE_MAPPED_MODEL):
+        self.model_path = model_path
+        self.vectorizer_path = vectorizer_path
+        self.forest_path = forest_path
+        self.mapped_path = mapped_path
+        self.use_mapped = use_mapped
+        self._lock = threading.Lock()
+        self._entry = None  # (fingerprint, model or None, vectorizer, engine), replaced as a whole on reload
+        self._stats = {"loads": 0, "hits": 0, "last_load_seconds": None, "total_load_seconds": 0.0, "loaded_at": None,
+                       "format": None}
+
+    def _fingerprint(self):
+        if not os.path.exists(self.model_path) or not os.path.exists(self.vectorizer_path):
+            raise FileNotFoundError("Model files not found! Please train the model first using train.py.")
+        pointer_path = os.path.join(self.mapped_path, MAPPED_POINTER) if self.use_mapped else None
+        fingerprint = []
+        for path in (self.model_path, self.vectorizer_path, self.forest_path, pointer_path):
+            if path is None or not os.path.exists(path):
+                fingerprint.append(None)
+                continue
+            stat = os.stat(path)
+            fingerprint.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(fingerprint)
+
+    @staticmethod
+    def _is_current(stamp, model_stamp):
+        return stamp is not None and stamp[0] >= model_stamp[0]
+
+    def _load_engine(self, fingerprint, model):
+        model_stamp, _, forest_stamp, _ = fingerprint
+        if not self._is_current(forest_stamp, model_stamp):
+            return None
+        engine = ForestEngine.load(self.forest_path)
+        if not np.array_equal(engine.classes, model.classes_):
+            print("⚠ Forest arrays do not match the model; using scikit-learn inference.")
+            return None
+        return engine
+
+    def _mapped_version(self, fingerprint):
+        """The current mapped version directory if it was exported from these pickles, else None."""
+        if not self.use_mapped or fingerprint[3] is None:
+            return None
+        version_path = current_mapped_version(self.mapped_path)
+        if version_path is None:
+            return None
+        try:
+            with open(os.path.join(version_path, MAPPED_MANIFEST)) as f:
+                sources = json.load(f)["sources"]
+        except (OSError, ValueError, KeyError):
+            return None
+        if sources != {"model": list(fingerprint[0]), "vectorizer": list(fingerprint[1])}:
+            print("⚠ Memory-mapped export was built from other model files; loading the pickles.")
+            return None
+        return version_path
+
+    def _load(self):
+        """Load the artifacts, retrying if train.py rewrites them mid-read."""
+        for attempt in range(3):
+            before = self._fingerprint()
+            if attempt < 2 and before[1][0] > before[0][0]:
+                # train.py replaces the vectorizer just before the model; wait for the pair to match
+                time.sleep(0.5)
+                continue
+            version_path = self._mapped_version(before)
+            if version_path is not None:
+                with open(os.path.join(version_path, "vectorizer.pkl"), "rb") as vec_file:
+                    vectorizer = joblib.load(vec_file)
+                model, engine = None, ForestEngine.load(version_path)
+            else:
+                with open(self.model_path, "rb") as model_file:
+                    model = joblib.load(model_file)
+                with open(self.vectorizer_path, "rb") as vec_file:
+                    vectorizer = joblib.load(vec_file)
+                engine = self._load_engine(before, model)
+            if self._fingerprint() == before:
+                return before, model, vectorizer, engine
+        raise RuntimeError("Model files kept changing while loading; try again once training has finished.")
+
+    def _with_model(self, entry):
+        """Add the scikit-learn model, unpickled from the same export version, to a memory-mapped entry."""
+        with self._lock:
+            current = self._entry
+            if current is not None and current[0] == entry[0] and current[1] is not None:
+                return current  # Another session loaded it while we waited for the lock
+            with span("model.load", part="sklearn"):
+                with open(os.path.join(entry[3].path, "career_recommendation_model.pkl"), "rb") as model_file:
+                    model = joblib.load(model_file)
+            entry = (entry[0], model, entry[2], entry[3])
+            if current is not None and current[0] == entry[0]:
+                self._entry = entry
+            return entry
+
+    def _current(self):
+        fingerprint = self._fingerprint()
+        entry = self._entry
+        if entry is not None and entry[0] == fingerprint:
+            with self._lock:
+                self._stats["hits"] += 1
+            return entry
+
+        with self._lock:
+            # Another session may have finished the reload while we waited for the lock
+            entry = self._entry
+            if entry is not None and entry[0] == self._fingerprint():
+                self._stats["hits"] += 1
+                return entry
+
+            start = time.perf_counter()
+            with span("model.load") as load_span:
+                entry = self._load()
+                mapped = entry[1] is None
+                if mapped:  # Mapped arrays are paged in as they are read; only the vectorizer is unpickled
+                    load_span.add_bytes(os.path.getsize(os.path.join(entry[3].path, "vectorizer.pkl")))
+                else:
+                    load_span.add_bytes(sum(stamp[1] for stamp in entry[0][:3] if stamp is not None))
+            elapsed = time.perf_counter() - start
+            self._entry = entry  # Single assignment: readers see either the old or the new set
+            self._stats["loads"] += 1
+            self._stats["last_load_seconds"] = elapsed
+            self._stats["total_load_seconds"] += elapsed
+            self._stats["loaded_at"] = time.time()
+            self._stats["format"] = "mapped" if mapped else "pickle"
+
+        engine_note = " (memory-mapped forest)" if mapped else " (+ compiled forest)" if entry[3] is not None else ""
+        print(f"✅ Model & Vectorizer{engine_note} loaded successfully in {elapsed:.2f}s.")
+        return entry
+
+    def get(self):
+        """Return (model, vectorizer), reloading them only if the files on disk changed."""
+        entry = self._current()
+        if entry[1] is None:
+            entry = self._with_model(entry)
+        return entry[1], entry[2]
+
+    def get_predictor(self):
+        """Return (predictor, vectorizer): the compiled ForestEngine if exported, else the model."""
+        entry = self._current()
+        return (entry[3] if entry[3] is not None else entry[1]), entry[2]
+
+    def stats(self):
+        """Return a snapshot of load and cache-hit counters."""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["loads"] + stats["hits"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Drop the cached artifacts so the next call reloads them from disk."""
+        with self._lock:
+            self._entry = None
+
+# Shared by every session in this process (module imports are cached by Python)
+MODEL_REGISTRY = ModelRegistry()
+
 def load_model():
-    """Load the trained model and vectorizer."""
-    if not os.path.exists(MODEL_PATH) or not os.path.exists(VECTORIZER_PATH):
-        raise FileNotFoundError("Model files not found! Please train the model first using train.py.")
+    """Load the trained model and vectorizer (cached per process, reloaded when retrained)."""
+    return MODEL_REGISTRY.get()
+
+def load_predictor():
+    """Load the fastest available single-request predictor and the vectorizer."""
+    return MODEL_REGISTRY.get_predictor()
+
+def get_model_stats():
+    """Return model load-time and cache-hit statistics."""
+    return MODEL_REGISTRY.stats()
 
-    with open(MODEL_PATH, "rb") as model_file:
-        model = pickle.load(model_file)
-    with open(VECTORIZER_PATH, "rb") as vec_file:
-        vectorizer = pickle.load(vec_file)
+class MarketData:
+    """Columnar market table with hash indexes on "Job Id" and "Job Title" (first match wins)."""
 
-    print("✅ Model & Vectorizer loaded successfully.")
-    return model, vectorizer
+    def __init__(self, frame):
+        self.frame = frame
+        self.columns = frame.columns
+        self._by_job_id = self._build_index("Job Id")
+        self._by_title = self._build_index("Job Title")
+
+    def _build_index(self, column):
+        if column not in self.frame.columns:
+            return None
+        keys = self.frame[column]
+        first = ~keys.duplicated()
+        return dict(zip(keys[first].tolist(), first.to_numpy().nonzero()[0].tolist()))
+
+    def row_for_job_id(self, job_id):
+        """Return the first row for a Job Id, or None."""
+        position = self._by_job_id.get(job_id) if self._by_job_id is not None else None
+        return None if position is None else self.frame.iloc[position]
+
+    def row_for_title(self, job_title):
+        """Return the first row for a Job Title, or None."""
+        with span("market.lookup", by="title"):
+            position = self._by_title.get(job_title) if self._by_title is not None else None
+            return None if position is None else self.frame.iloc[position]
+
+    def records_for_job_ids(self, job_ids, columns=None):
+        """Resolve many Job Ids with one positional take; returns {job_id: {column: value}}."""
+        if self._by_job_id is None:
+            return {}
+        with span("market.lookup", by="job_id"):
+            found = {job_id: self._by_job_id[job_id] for job_id in set(job_ids) if job_id in self._by_job_id}
+            if not found:
+                return {}
+            rows = self.frame.iloc[list(found.values())]
+            if columns is not None:
+                rows = rows[[col for col in columns if col in rows.columns]]
+            return dict(zip(found.keys(), rows.to_dict("records")))
+
+    def __len__(self):
+        return len(self.frame)
+
+class MarketDataStore:
+    """
+    Loads the market CSV once per process into a compact columnar cache.
+
+    Repeated string columns are stored as categoricals and written to a Feather file next to
+    the CSV (when pyarrow is installed), which is rebuilt whenever the CSV is newer. The
+    in-memory copy is reloaded when the CSV's fingerprint changes.
+    """
+
+    def __init__(self, csv_path=MARKET_DATA_PATH):
+        self.csv_path = csv_path
+        self.cache_path = os.path.splitext(csv_path)[0] + ".feather"
+        self._lock = threading.Lock()
+        self._entry = None  # (fingerprint, MarketData)
+
+    def _fingerprint(self):
+        if not os.path.exists(self.csv_path):
+            raise FileNotFoundError("Market data file not found!")
+        stat = os.stat(self.csv_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _compact(frame):
+        """Dictionary-encode string columns with many repeated values."""
+        for col in frame.columns:
+            if frame[col].dtype == object and frame[col].nunique() <= len(frame) // 2:
+                frame[col] = frame[col].astype("category")
+        return frame
+
+    def _read(self):
+        csv_mtime = os.path.getmtime(self.csv_path)
+        if os.path.exists(self.cache_path) and os.path.getmtime(self.cache_path) >= csv_mtime:
+            try:
+                return pd.read_feather(self.cache_path)
+            except ImportError:
+                pass
+
+        frame = self._compact(pd.read_csv(self.csv_path))
+        try:
+            tmp_path = self.cache_path + ".tmp"
+            frame.to_feather(tmp_path)
+            os.replace(tmp_path, self.cache_path)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"⚠ Market data cache not written ({e}); using the CSV directly.")
+        return frame
+
+    def get(self):
+        """Return the indexed MarketData, reloading it only if the CSV changed."""
+        fingerprint = self._fingerprint()
+        entry = self._entry
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entry
+            if entry is not None and entry[0] == fingerprint:
+                return entry[1]
+            with span("market.load"):
+                market_data = MarketData(self._read())
+            self._entry = (fingerprint, market_data)
+
+        print(f"✅ Reference data loaded successfully ({len(market_data)} rows).")
+        return market_data
+
+MARKET_DATA_STORE = MarketDataStore()
 
 def load_market_data():
-    """Load market data CSV."""
-    if not os.path.exists(MARKET_DATA_PATH):
-        raise FileNotFoundError("Market data file not found!")
-    
-    market_data = pd.read_csv(MARKET_DATA_PATH)
-    print("✅ Reference data loaded successfully.")
-    return market_data
+    """Load the indexed market data (cached per process, rebuilt when the CSV changes)."""
+    return MARKET_DATA_STORE.get()
 
 def get_market_insights(job_title, market_data):
     """Fetch job market insights for the predicted job title."""
@@ -79,54 +463,194 @@ def get_market_insights(job_title, market_data):
         print("\n❌ ERROR: 'Job Title' column missing in market data.")
         exit(1)
     
-    job_info = market_data[market_data["Job Title"] == job_title]
+    job_info = market_data.row_for_title(job_title)
 
-    if job_info.empty:
+    if job_info is None:
         print("\n⚠ No market insights available for this job title.")
         return None
     
-    return job_info.iloc[0]
+    return job_info
+
+BATCH_COLUMNS = ["Job Title", "Salary Range", "Demand Level"]
+
+def normalize_skills(skills_input):
+    """Turn a comma-separated skills string into the text the vectorizer was trained on."""
+    return " ".join(s.strip().lower() for s in str(skills_input).split(",") if s.strip())
+
+def top_k_jobs(probabilities, classes, k):
+    """
+    Rank the k most likely classes per row without sorting every class.
+
+    Returns (job_ids, probabilities), both shaped (n_rows, k) and ordered best first.
+    """
+    k = min(k, probabilities.shape[1])
+    candidates = np.argpartition(-probabilities, k - 1, axis=1)[:, :k]
+    candidate_probs = np.take_along_axis(probabilities, candidates, axis=1)
+    order = np.argsort(-candidate_probs, axis=1, kind="stable")
+    top = np.take_along_axis(candidates, order, axis=1)
+    return classes[top], np.take_along_axis(candidate_probs, order, axis=1)
+
+def score(model, vectorizer, skills_texts):
+    """Class probabilities for normalized skill strings, timed as two spans (transform, predict_proba)."""
+    engine = "forest" if isinstance(model, ForestEngine) else "sklearn"
+    with span("predict.transform"):
+        features = vectorizer.transform(skills_texts)
+    with span("predict.predict_proba", engine=engine):
+        return model.predict_proba(features)
+
+def recommend_jobs(skills_text, k=TOP_K):
+    """
+    Score normalized skills text once and return the top-k jobs.
+
+    Each entry is (job_id, confidence %, market record or None). Confidences are the forest's
+    averaged class probabilities, so they sum to 100% across all jobs. Market records for all
+    k jobs are resolved in a single indexed lookup.
+    """
+    model, vectorizer = load_predictor()
+    market_data = load_market_data()
+    probabilities = score(model, vectorizer, [skills_text])
+    job_ids, job_probs = top_k_jobs(probabilities, model.classes_, k)
+    job_ids, job_probs = job_ids[0].tolist(), job_probs[0].tolist()
+    records = market_data.records_for_job_ids(job_ids)
+    return [(job_id, prob * 100, records.get(job_id)) for job_id, prob in zip(job_ids, job_probs)]
+
+def format_recommendation(top_jobs):
+    """Result dict for get_job_recommendation from ranked (job_id, confidence %, market record) entries."""
+    predicted_job_id, confidence, market_insights_row = top_jobs[0]
+    if market_insights_row is None:
+        return {"error": "No matching job found for the prediction."}
+    predicted_job_title = market_insights_row["Job Title"]
+    # Market insights
+    avg_salary = market_insights_row.get("Salary Range", "N/A")
+    demand_level = market_insights_row.get("Demand Level", "N/A")
+    market_insights_html = ""
+    for col, value in market_insights_row.items():
+        if col not in ["Job Title", "Salary Range", "Demand Level", "Job Id"]:
+            market_insights_html += f"<b>{col}:</b> {value}<br>"
+    # Dummy skills improvement (customize as needed)
+    skills_improvement = "Consider improving your communication, teamwork, and leadership skills."
+    alternatives = [
+        f"<li>{row['Job Title']} — {job_confidence:.1f}% match</li>"
+        for _, job_confidence, row in top_jobs[1:]
+        if row is not None and row["Job Title"] != predicted_job_title and job_confidence >= MIN_ALTERNATIVE_CONFIDENCE
+    ]
+    alternative_jobs = f"<ul>{''.join(alternatives)}</ul>" if alternatives else ""
+    return {
+        "job_title": predicted_job_title,
+        "confidence": f"{confidence:.1f}",
+        "avg_salary": avg_salary,
+        "demand_level": demand_level,
+        "market_insights": market_insights_html or "No additional insights available.",
+        "skills_improvement": skills_improvement,
+        "alternative_jobs": alternative_jobs,
+        "top_jobs": [
+            {"job_id": job_id, "job_title": row["Job Title"] if row is not None else None, "confidence": round(job_confidence, 1)}
+            for job_id, job_confidence, row in top_jobs
+        ],
+    }
+
+def recommend_jobs_batch(skills_texts, k=TOP_K):
+    """
+    recommend_jobs() for many normalized skill strings with one transform + predict_proba call
+    and one market data lookup; returns a list of top-k entries per input, in input order.
+    A single input takes the ForestEngine path, which is faster than scikit-learn for one row.
+    """
+    model, vectorizer = load_predictor() if len(skills_texts) == 1 else load_model()
+    market_data = load_market_data()
+    probabilities = score(model, vectorizer, skills_texts)
+    job_ids, job_probs = top_k_jobs(probabilities, model.classes_, k)
+    job_ids, confidences = job_ids.tolist(), (job_probs * 100).tolist()
+    records = market_data.records_for_job_ids([job_id for row in job_ids for job_id in row])
+    return [
+        [(job_id, confidence, records.get(job_id)) for job_id, confidence in zip(row_ids, row_confidences)]
+        for row_ids, row_confidences in zip(job_ids, confidences)
+    ]
+
+def predict_batch(skills_inputs, chunk_size=2048, k=1):
+    """
+    Score many comma-separated skill strings at once.
+
+    Each chunk is vectorized into one sparse matrix and scored with a single predict_proba
+    call; market data for all predicted jobs in the chunk is joined in one lookup. With k > 1
+    each result also lists its next-best "alternatives".
+    Yields one result dict per input, in input order.
+    """
+    model, vectorizer = load_model()
+    market_data = load_market_data()
+    skills_inputs = iter(skills_inputs)
+
+    while True:
+        chunk = [normalize_skills(skills) for _, skills in zip(range(chunk_size), skills_inputs)]
+        if not chunk:
+            return
+
+        scored = [i for i, text in enumerate(chunk) if text]
+        results = [{"error": "No skills provided."} for _ in chunk]
+        if scored:
+            probabilities = score(model, vectorizer, [chunk[i] for i in scored])
+            job_ids, job_probs = top_k_jobs(probabilities, model.classes_, k)
+            job_ids, confidences = job_ids.tolist(), (job_probs * 100).tolist()
+            insights = market_data.records_for_job_ids([job_id for row in job_ids for job_id in row], BATCH_COLUMNS)
+
+            for i, row_ids, row_confidences in zip(scored, job_ids, confidences):
+                row = insights.get(row_ids[0])
+                if row is None:
+                    results[i] = {"error": "No matching job found for the prediction."}
+                    continue
+                results[i] = {
+                    "job_id": row_ids[0],
+                    "job_title": row.get("Job Title"),
+                    "confidence": round(row_confidences[0], 1),
+                    "avg_salary": row.get("Salary Range", "N/A"),
+                    "demand_level": row.get("Demand Level", "N/A"),
+                }
+                if k > 1:
+                    results[i]["alternatives"] = [
+                        {"job_id": job_id, "job_title": insights[job_id].get("Job Title"), "confidence": round(confidence, 1)}
+                        for job_id, confidence in zip(row_ids[1:], row_confidences[1:])
+                        if job_id in insights and confidence >= MIN_ALTERNATIVE_CONFIDENCE
+                    ]
+
+        yield from results
 
 def main():
     """Main function to predict career recommendation."""
-    model, vectorizer = load_model()
     market_data = load_market_data()
 
     # User input
     skills = input("\n📝 Enter your skills (comma-separated): ")
-    skills_list = [s.strip().lower() for s in skills.split(",")]
-
-    # Transform input skills
-    skills_vectorized = vectorizer.transform([" ".join(skills_list)])
-
-    # Predict job
-    predicted_job_id = model.predict(skills_vectorized)[0]
 
     # Fetch job title from market data
     if "Job Id" not in market_data.columns or "Job Title" not in market_data.columns:
         print("\n❌ ERROR: Required columns missing in market data.")
         exit(1)
 
-    job_row = market_data[market_data["Job Id"] == predicted_job_id]
+    # Predict the top jobs in one pass
+    top_jobs = recommend_jobs(normalize_skills(skills), k=TOP_K)
+    _, confidence, market_insights = top_jobs[0]
 
-    if job_row.empty:
+    if market_insights is None:
         print("\n⚠ No matching job found for the prediction.")
         exit(1)
 
-    predicted_job_title = job_row["Job Title"].values[0]
-    confidence = model.predict_proba(skills_vectorized).max() * 100
-
     print("\n🎯 Career Recommendation")
     print("=" * 40)
-    print(f"🏆 Recommended Job Title: {predicted_job_title}")
+    print(f"🏆 Recommended Job Title: {market_insights['Job Title']}")
     print(f"🔍 Confidence: {confidence:.1f}%")
 
-    # Fetch market insights
-    market_insights = get_market_insights(predicted_job_title, market_data)
-    if market_insights is not None:
-        print(f"💼 Company: {market_insights['Company']}")
-        print(f"📍 Location: {market_insights['location']}")
-        print(f"💰 Salary Range: {market_insights['Salary Range']}")
+    # Market insights
+    print(f"💼 Company: {market_insights.get('Company', 'N/A')}")
+    print(f"📍 Location: {market_insights.get('location', 'N/A')}")
+    print(f"💰 Salary Range: {market_insights.get('Salary Range', 'N/A')}")
+
+    alternatives = [
+        (row["Job Title"], job_confidence) for _, job_confidence, row in top_jobs[1:]
+        if row is not None and job_confidence >= MIN_ALTERNATIVE_CONFIDENCE
+    ]
+    if alternatives:
+        print("\n🔄 Alternative Careers")
+        for title, job_confidence in alternatives:
+            print(f"• {title} ({job_confidence:.1f}%)")
 
 if __name__ == "__main__":
     main()
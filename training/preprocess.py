@@ -1,43 +1,173 @@
-import pandas as pd
+import argparse
 import os
+import time
+
+import numpy as np
+import pandas as pd
 
 # Load dataset
 file_path = "data/skills_data.csv"  # Ensure the correct path
 output_dir = "data/processed_data"
 output_path = os.path.join(output_dir, "processed_skills_data.csv")
+parquet_output_path = os.path.join(output_dir, "processed_skills_data.parquet")
 
-# Ensure the output directory exists
-os.makedirs(output_dir, exist_ok=True)
+# Rows read per chunk; peak memory is bounded by this, not by the input size
+CHUNK_SIZE = 50_000
+essential_columns = ["job title", "skills"]
 
-# Read the dataset
-try:
-    df = pd.read_csv(file_path)
-    print("✅ Dataset loaded successfully.")
-except FileNotFoundError:
-    print(f"❌ Error: File '{file_path}' not found. Please check the path.")
-    exit()
+class RowDeduplicator:
+    """
+    Cross-chunk duplicate filter that keeps only a sorted array of 64-bit row hashes
+    (8 bytes per unique row instead of the rows themselves).
+    """
 
-# Display initial dataset info
-print("\n🔹 Initial Dataset Info:")
-print(df.info())
+    def __init__(self):
+        self.seen = np.empty(0, dtype=np.uint64)
 
-# Convert all column names to lowercase for consistency
-df.columns = df.columns.str.lower().str.strip()
+    def keep_mask(self, chunk):
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        # First occurrence within the chunk...
+        keep = ~pd.Series(hashes).duplicated().to_numpy()
+        # ...that was not seen in an earlier chunk
+        if len(self.seen):
+            positions = np.minimum(np.searchsorted(self.seen, hashes), len(self.seen) - 1)
+            keep &= self.seen[positions] != hashes
+        # Merge the new hashes into the sorted array instead of re-sorting all of it
+        new = np.sort(hashes[keep])
+        self.seen = np.insert(self.seen, np.searchsorted(self.seen, new), new)
+        return keep
 
-# Drop rows with missing essential columns
-essential_columns = ["job title", "skills"]
-df = df.dropna(subset=essential_columns)
+def clean_chunk(chunk, deduplicator):
+    """Normalize columns, drop incomplete rows and duplicates, and parse dates for one chunk."""
+    # Convert all column names to lowercase for consistency
+    chunk.columns = chunk.columns.str.lower().str.strip()
+
+    # Drop rows with missing essential columns
+    chunk = chunk.dropna(subset=essential_columns)
+
+    # Handle duplicate entries if any
+    chunk = chunk[deduplicator.keep_mask(chunk)]
+
+    # Convert date column to datetime format
+    if "job posting date" in chunk.columns:
+        chunk = chunk.assign(**{"job posting date": pd.to_datetime(chunk["job posting date"], errors="coerce")})
+    return chunk
+
+class ParquetChunkWriter:
+    """Appends chunks to one Parquet file as row groups, using the first chunk's schema."""
+
+    def __init__(self, path):
+        import pyarrow  # noqa: F401 - fail early so the caller can fall back to CSV
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.writer = None
+        self.schema = None
+
+    def write(self, chunk):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.writer is None:
+            schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+            # Text columns that happen to be empty/null in the first chunk still hold text later
+            for i, field in enumerate(schema):
+                if pa.types.is_null(field.type) or pd.api.types.is_string_dtype(chunk[field.name]):
+                    schema = schema.set(i, pa.field(field.name, pa.string()))
+            self.schema = schema
+            self.writer = pq.ParquetWriter(self.tmp_path, schema)
+        self.writer.write_table(pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Discard the partial output, leaving any previous file at self.path untouched."""
+        if self.writer is not None:
+            self.writer.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+class CsvChunkWriter:
+    """Appends chunks to one CSV file, writing the header once."""
+
+    def __init__(self, path):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.header_written = False
+
+    def write(self, chunk):
+        chunk.to_csv(self.tmp_path, mode="a" if self.header_written else "w", header=not self.header_written, index=False)
+        self.header_written = True
+
+    def close(self):
+        if self.header_written:
+            os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Discard the partial output, leaving any previous file at self.path untouched."""
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+def preprocess(input_path=file_path, output_format="parquet", chunk_size=CHUNK_SIZE):
+    """Stream the raw dataset through clean_chunk() and write the result chunk by chunk."""
+    writer = None
+    if output_format == "parquet":
+        try:
+            writer = ParquetChunkWriter(parquet_output_path)
+        except ImportError:
+            print("⚠ pyarrow is not installed; writing CSV instead of Parquet.")
+    if writer is None:
+        writer = CsvChunkWriter(output_path)
+
+    deduplicator = RowDeduplicator()
+    rows_in = rows_out = 0
+    start = time.perf_counter()
+    try:
+        # Read everything as text: per-chunk type inference would give the same value different
+        # dtypes (5 vs 5.0 once a chunk has a blank), so rows would hash differently across chunks.
+        # The date column is parsed from this text in clean_chunk().
+        for chunk in pd.read_csv(input_path, chunksize=chunk_size, dtype=str):
+            rows_in += len(chunk)
+            chunk = clean_chunk(chunk, deduplicator)
+            rows_out += len(chunk)
+            writer.write(chunk)
+            print(f"🔹 Processed {rows_in:,} rows ({rows_in / (time.perf_counter() - start):,.0f} rows/sec)")
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "output_path": writer.path,
+        "rows_in": rows_in,
+        "rows_out": rows_out,
+        "seconds": elapsed,
+        "rows_per_second": rows_in / elapsed if elapsed else None,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean the raw skills dataset in bounded memory.")
+    parser.add_argument("--input", default=file_path, help="Raw skills CSV")
+    parser.add_argument("--format", choices=["parquet", "csv"], default="parquet", help="Output format (Parquet needs pyarrow)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows read and written per chunk")
+    args = parser.parse_args()
+
+    # Ensure the output directory exists
+    os.makedirs(output_dir, exist_ok=True)
 
-# Handle duplicate entries if any
-df = df.drop_duplicates()
+    if not os.path.exists(args.input):
+        print(f"❌ Error: File '{args.input}' not found. Please check the path.")
+        exit()
 
-# Convert date column to datetime format
-if "job posting date" in df.columns:
-    df["job posting date"] = pd.to_datetime(df["job posting date"], errors="coerce")
+    summary = preprocess(args.input, args.format, args.chunk_size)
 
-# Save processed data
-df.to_csv(output_path, index=False)
+    print("\n✅ Preprocessing complete!")
+    print(f"📂 Processed file saved at: {summary['output_path']}")
+    print(f"📊 Rows: {summary['rows_in']:,} read, {summary['rows_out']:,} kept")
+    print(f"⏱ {summary['seconds']:.1f}s ({summary['rows_per_second']:,.0f} rows/sec)")
 
-print("\n✅ Preprocessing complete!")
-print(f"📂 Processed file saved at: {output_path}")
-print(f"📊 Final Dataset Shape: {df.shape}")
+if __name__ == "__main__":
+    main()
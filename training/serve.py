@@ -0,0 +1,207 @@
+"""
+Local prediction service with micro-batching.
+
+One process holds the model and market data for every Streamlit worker. Incoming skill
+strings are queued and gathered into micro-batches, bounded by MAX_BATCH_SIZE and by
+MAX_WAIT_MS after the first request arrives. Each batch is scored with a single
+vectorize + predict_proba call.
+
+Endpoints:
+    POST /recommend  {"skills": "Python, SQL"}  -> same dict as get_job_recommendation()
+    GET  /stats      batch-size histogram, queue latency and model registry stats
+    GET  /metrics    spans (transform, predict_proba, lookups, ...) in Prometheus text format
+    GET  /health
+
+Run from the project root, then set PREDICTION_SERVER_URL=http://127.0.0.1:8502 for the app:
+    python -m training.serve --port 8502
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from training.predict import (
+    TOP_K,
+    format_recommendation,
+    get_model_stats,
+    load_market_data,
+    load_model,
+    normalize_skills,
+    recommend_jobs_batch,
+)
+from utils.helpers import percentile_ms
+from utils.metrics import export_prometheus
+
+MAX_BATCH_SIZE = int(os.getenv("PREDICTION_MAX_BATCH_SIZE", "64"))
+MAX_WAIT_MS = float(os.getenv("PREDICTION_MAX_WAIT_MS", "5"))
+REQUEST_TIMEOUT = 30
+
+class MicroBatcher:
+    """
+    Queue of pending skill strings drained by one worker thread.
+
+    The worker blocks for the first request, then keeps collecting until the batch holds
+    max_batch_size requests or max_wait_ms has passed, and scores the batch in one call.
+    Each submit() returns a Future resolved with that request's top-k entries.
+    """
+
+    def __init__(self, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS, k=TOP_K):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.k = k
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._batch_sizes = Counter()
+        self._queue_latencies = deque(maxlen=10000)
+        self._batch_seconds = deque(maxlen=1000)
+        self._counts = {"requests": 0, "batches": 0, "errors": 0}
+        self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, skills_text):
+        future = Future()
+        self._queue.put((skills_text, future, time.perf_counter()))
+        return future
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+            try:
+                results = recommend_jobs_batch([skills_text for skills_text, _, _ in batch], k=self.k)
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                error = True
+            else:
+                for (_, future, _), top_jobs in zip(batch, results):
+                    future.set_result(top_jobs)
+                error = False
+
+            with self._lock:
+                self._batch_sizes[len(batch)] += 1
+                self._queue_latencies.extend(started - enqueued for _, _, enqueued in batch)
+                self._batch_seconds.append(time.perf_counter() - started)
+                self._counts["requests"] += len(batch)
+                self._counts["batches"] += 1
+                self._counts["errors"] += error * len(batch)
+
+    def stats(self):
+        """Counters, batch-size histogram and queue-wait / batch-scoring percentiles (ms)."""
+        with self._lock:
+            histogram = dict(sorted(self._batch_sizes.items()))
+            latencies = list(self._queue_latencies)
+            batch_seconds = list(self._batch_seconds)
+            counts = dict(self._counts)
+
+        return {
+            **counts,
+            "queued": self._queue.qsize(),
+            "mean_batch_size": round(counts["requests"] / counts["batches"], 2) if counts["batches"] else None,
+            "batch_size_histogram": histogram,
+            "queue_wait_ms": {"p50": percentile_ms(latencies, 0.5), "p95": percentile_ms(latencies, 0.95),
+                              "p99": percentile_ms(latencies, 0.99), "max": percentile_ms(latencies, 1.0)},
+            "batch_ms": {"p50": percentile_ms(batch_seconds, 0.5), "p95": percentile_ms(batch_seconds, 0.95)},
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+class PredictionServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # The default listen backlog of 5 resets connections under bursts
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    batcher = None  # Set by make_server()
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._send_json(200, {"batching": self.batcher.stats(), "model": get_model_stats()})
+        elif self.path == "/metrics":
+            data = export_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._send_json(404, {"error": "Not found."})
+
+    def do_POST(self):
+        if self.path != "/recommend":
+            self._send_json(404, {"error": "Not found."})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            skills_text = normalize_skills(str(request.get("skills", "")))
+        except (ValueError, AttributeError):
+            self._send_json(400, {"error": "Expected a JSON object with a \"skills\" string."})
+            return
+        if not skills_text:
+            self._send_json(200, {"error": "No skills provided."})
+            return
+        try:
+            result = format_recommendation(self.batcher.submit(skills_text).result(timeout=REQUEST_TIMEOUT))
+        except FileNotFoundError as e:
+            result = {"error": str(e)}
+        except Exception as e:
+            result = {"error": f"Prediction failed: {str(e)}"}
+        self._send_json(200, result)
+
+    def log_message(self, format, *args):
+        pass  # One line per request would dominate the cost of a micro-batched call
+
+def make_server(host="127.0.0.1", port=8502, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS):
+    """Load the model and market data up front, then return a ready PredictionServer."""
+    load_model()
+    load_market_data()
+    handler = type("Handler", (PredictionHandler,), {"batcher": MicroBatcher(max_batch_size, max_wait_ms)})
+    return PredictionServer((host, port), handler)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve job recommendations with micro-batching.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE, help="Requests scored per predict_proba call")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS, help="How long a batch waits to fill up")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.max_batch_size, args.max_wait_ms)
+    print(f"✅ Prediction server on http://{args.host}:{args.port} "
+          f"(batches of up to {args.max_batch_size}, {args.max_wait_ms} ms wait)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
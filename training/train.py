@@ -1,44 +1,466 @@
+import argparse
+import copy
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import itemgetter
+
 import pandas as pd
+import numpy as np
 import joblib
-import os
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import KFold, ParameterGrid, ParameterSampler, train_test_split
+from sklearn.preprocessing import FunctionTransformer, LabelEncoder
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+from sklearn.feature_selection import SelectKBest, chi2
+from sklearn.pipeline import Pipeline
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if not __package__:  # Run as `python training/train.py`: make the project root importable
+    sys.path.insert(0, PROJECT_ROOT)
+from training.evaluate import load_dataset
+from training.predict import MAPPED_MANIFEST, MAPPED_POINTER, MappedVocabulary, current_mapped_version
+
+def forest_arrays(model, n_features):
+    """
+    Flatten a fitted RandomForestClassifier into the structure-of-arrays format read by
+    predict.ForestEngine. Node ids are global across trees; leaves are their own children
+    with threshold +inf, and leaf class probabilities are stored CSR-style (nonzeros only).
+    """
+    features, thresholds, children, leaf_counts, leaf_classes, leaf_probs, roots = [], [], [], [], [], [], []
+    offset = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        node_ids = np.arange(tree.node_count)
+        is_leaf = tree.children_left == -1
+        features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+        left = np.where(is_leaf, node_ids, tree.children_left) + offset
+        right = np.where(is_leaf, node_ids, tree.children_right) + offset
+        children.append(np.column_stack([left, right]).astype(np.int32))
+
+        values = tree.value[:, 0, :]
+        probs = values / values.sum(axis=1, keepdims=True)
+        nodes, classes = np.nonzero(probs * is_leaf[:, None])
+        leaf_counts.append(np.bincount(nodes, minlength=tree.node_count))
+        leaf_classes.append(classes.astype(np.int32))
+        leaf_probs.append(probs[nodes, classes])
+        roots.append(offset)
+        offset += tree.node_count
+
+    return dict(
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds),
+        children=np.concatenate(children),
+        leaf_ptr=np.concatenate([[0], np.cumsum(np.concatenate(leaf_counts))]).astype(np.int64),
+        leaf_class=np.concatenate(leaf_classes),
+        leaf_prob=np.concatenate(leaf_probs),
+        roots=np.array(roots, dtype=np.int32),
+        classes=model.classes_,
+        n_features=n_features,
+        max_depth=max(estimator.tree_.max_depth for estimator in model.estimators_) + 1,
+    )
+
+def export_mapped_artifacts(model, vectorizer, n_features, directory, model_path, vectorizer_path):
+    """
+    Write the memory-mapped serving format read by predict.ModelRegistry into a new version
+    directory under `directory`: one uncompressed .npy file per forest array, the vocabulary
+    as sorted UTF-8 terms plus their columns, a vectorizer.pkl whose vocabulary_ is a
+    MappedVocabulary over them, a hard link (or copy) of the model pickle at model_path, and
+    its manifest.json. The manifest records the (mtime, size) fingerprints of model_path and
+    vectorizer_path, so the registry only serves this version next to the pickles it was built
+    from. The MAPPED_POINTER file is then switched to the new version with os.replace.
+
+    Files are never renamed or overwritten once written, so processes that have the previous
+    version mapped keep reading it (and Windows, which locks mapped files, is fine). The
+    previous version is kept until the next export, since readers only move on once they
+    reload; older ones are removed where nothing holds them open.
+    """
+    os.makedirs(directory, exist_ok=True)
+    previous = current_mapped_version(directory)
+    stamp = time.strftime("v%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+    for attempt in itertools.count():
+        version = stamp if attempt == 0 else f"{stamp}-{attempt}"  # Several exports within a second
+        version_path = os.path.join(directory, version)
+        try:
+            os.makedirs(version_path)
+            break
+        except FileExistsError:
+            continue
+
+    arrays = forest_arrays(model, n_features)
+    manifest = {"n_features": int(arrays.pop("n_features")), "max_depth": int(arrays.pop("max_depth"))}
+    for name, array in arrays.items():
+        np.save(os.path.join(version_path, name + ".npy"), np.ascontiguousarray(array))
+
+    mapped_vectorizer = vectorizer
+    if getattr(vectorizer, "vocabulary_", None):
+        terms = sorted(term.encode("utf-8") for term in vectorizer.vocabulary_)
+        columns = np.array([vectorizer.vocabulary_[term.decode("utf-8")] for term in terms], dtype=np.int32)
+        terms = np.array(terms, dtype=bytes)
+        np.save(os.path.join(version_path, "vocabulary_terms.npy"), terms)
+        np.save(os.path.join(version_path, "vocabulary_columns.npy"), columns)
+        mapped_vectorizer = copy.copy(vectorizer)
+        mapped_vectorizer.vocabulary = None  # The fixed-vocabulary parameter is only read by fit()
+        mapped_vectorizer.vocabulary_ = MappedVocabulary(version_path, terms, columns)
+        manifest["vocabulary_terms"] = len(terms)
+    joblib.dump(mapped_vectorizer, os.path.join(version_path, "vectorizer.pkl"))
+    # The model pickle for batch scoring lives in the version too, so it always matches the arrays
+    try:
+        os.link(model_path, os.path.join(version_path, "career_recommendation_model.pkl"))
+    except OSError:  # No hard links on this file system
+        shutil.copyfile(model_path, os.path.join(version_path, "career_recommendation_model.pkl"))
+    manifest["sources"] = {}
+    for name, path in (("model", model_path), ("vectorizer", vectorizer_path)):
+        stat = os.stat(path)
+        manifest["sources"][name] = [stat.st_mtime_ns, stat.st_size]
+    with open(os.path.join(version_path, MAPPED_MANIFEST), "w") as f:
+        json.dump(manifest, f)
+
+    pointer_path = os.path.join(directory, MAPPED_POINTER)
+    with open(pointer_path + f".tmp-{os.getpid()}", "w") as f:
+        json.dump({"version": version}, f)
+    os.replace(pointer_path + f".tmp-{os.getpid()}", pointer_path)
+
+    keep = {version, MAPPED_POINTER} | ({os.path.basename(previous)} if previous else set())
+    for name in os.listdir(directory):
+        if name not in keep:
+            path = os.path.join(directory, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # Still mapped by a running process (Windows); removed by a later export
+
+MODELS_PATH = "data/models/"
+
+# Search space for --search; "vectorizer__" keys go to CountVectorizer, "forest__" keys to the forest
+SEARCH_SPACE = {
+    "vectorizer__min_df": [1, 2],
+    "vectorizer__ngram_range": [(1, 1), (1, 2)],
+    "vectorizer__binary": [False, True],
+    "forest__n_estimators": [100, 200],
+    "forest__max_depth": [None, 40],
+    "forest__min_samples_leaf": [1, 2],
+    "forest__max_features": ["sqrt", "log2"],
+}
+
+# --profile compact: smaller vocabulary and shallower trees, so serving processes unpickle less
+COMPACT_PROFILE = {
+    "min_df": 2,  # Drop skills seen in a single posting
+    "max_features": 20000,  # Most frequent terms kept before chi-squared selection
+    "k_best": 5000,  # Terms kept by chi-squared selection against the job title
+    "max_depth": 40,
+    "min_samples_leaf": 2,
+    "hash_bits": 18,  # --vectorizer hashing: 2**18 hashed feature columns, no stored vocabulary
+}
+ARTIFACT_FILES = ["career_recommendation_model.pkl", "vectorizer.pkl", "label_encoder.pkl", "forest_arrays.npz", "mapped"]
+
+# Loads the serving artifacts in a fresh interpreter and reports how much resident memory they add
+LOADED_RSS_SCRIPT = """
+import json, os, sys
+sys.path.insert(0, sys.argv[2])
+import joblib, numpy, scipy.sparse, sklearn.ensemble, sklearn.feature_extraction.text, sklearn.pipeline, sklearn.preprocessing
+from utils.helpers import rss_mb
+
+before = rss_mb()
+artifacts = [joblib.load(os.path.join(sys.argv[1], name)) for name in ("career_recommendation_model.pkl", "vectorizer.pkl")]
+print(json.dumps({"rss_mb": rss_mb(), "artifacts_rss_mb": rss_mb() - before}))
+"""
+
+def load_training_data():
+    """Load the processed dataset via evaluate.load_dataset() and check it has the label column."""
+    df = load_dataset()
+
+    # Debugging: Print column names
+    print("🔍 Columns in dataset (lowercased):", df.columns.tolist())
+
+    # Ensure "job title" exists (lowercase)
+    if "job title" not in df.columns:
+        raise ValueError("❌ ERROR: 'job title' column is missing in processed_skills_data.csv!")
+    return df
+
+def save_artifacts(label_encoder, vectorizer, model, n_features):
+    """Write the label encoder, vectorizer, model and memory-mapped serving export to MODELS_PATH."""
+    # stop_words_ (terms cut by min_df/max_features) is only kept for introspection and can
+    # be far larger than the vocabulary itself; transform() never reads it
+    for step in vectorizer.named_steps.values() if isinstance(vectorizer, Pipeline) else [vectorizer]:
+        if hasattr(step, "stop_words_"):
+            del step.stop_words_
+    # Each pickle is written to a temporary file and swapped in with os.replace, model last, so a
+    # hot-reloading reader never sees a partial file and only sees a new vectorizer alongside an
+    # older model during the swap (which predict.ModelRegistry waits out)
+    staged = []
+    for obj, name in ((label_encoder, "label_encoder.pkl"), (vectorizer, "vectorizer.pkl"),
+                      (model, "career_recommendation_model.pkl")):
+        temp_path = f"{MODELS_PATH}{name}.tmp-{os.getpid()}"
+        joblib.dump(obj, temp_path)
+        staged.append((temp_path, MODELS_PATH + name))
+    for temp_path, path in staged:
+        os.replace(temp_path, path)
+
+    # Memory-mapped forest and vocabulary for serving (written after the model so it is never older);
+    # this replaces the forest_arrays.npz written by earlier versions
+    export_mapped_artifacts(model, vectorizer, n_features, MODELS_PATH + "mapped",
+                            MODELS_PATH + "career_recommendation_model.pkl", MODELS_PATH + "vectorizer.pkl")
+    if os.path.exists(MODELS_PATH + "forest_arrays.npz"):
+        os.remove(MODELS_PATH + "forest_arrays.npz")
+
+def split_params(candidate):
+    """Split a flat search candidate into (vectorizer_params, forest_params)."""
+    vectorizer_params = {k.split("__", 1)[1]: v for k, v in candidate.items() if k.startswith("vectorizer__")}
+    forest_params = {k.split("__", 1)[1]: v for k, v in candidate.items() if k.startswith("forest__")}
+    return vectorizer_params, forest_params
+
+# Per-worker state, set once by the pool initializer so tasks only ship fold indices
+_WORKER_MATRICES = None
+_WORKER_TARGET = None
+
+def _init_worker(matrices, target):
+    global _WORKER_MATRICES, _WORKER_TARGET
+    _WORKER_MATRICES, _WORKER_TARGET = matrices, target
+
+def _fit_fold(candidate_id, vectorizer_key, forest_params, train_idx, val_idx):
+    """Fit one forest on one CV fold (single-threaded: the pool supplies the parallelism)."""
+    X, y = _WORKER_MATRICES[vectorizer_key], _WORKER_TARGET
+    start = time.perf_counter()
+    model = RandomForestClassifier(random_state=42, n_jobs=1, **forest_params)
+    model.fit(X[train_idx], y[train_idx])
+    fit_seconds = time.perf_counter() - start
+    return candidate_id, accuracy_score(y[val_idx], model.predict(X[val_idx])), fit_seconds
+
+def search(df, y, mode="grid", n_iter=20, cv=3, workers=None):
+    """
+    Cross-validated search over SEARCH_SPACE on a process pool.
+
+    Each distinct vectorizer configuration is fitted once and its feature matrix is shared by
+    every forest candidate that uses it. Returns (best_candidate, results) where results lists
+    mean CV accuracy and total fit time per candidate.
+    """
+    if mode == "grid":
+        candidates = list(ParameterGrid(SEARCH_SPACE))
+    else:
+        candidates = list(ParameterSampler(SEARCH_SPACE, n_iter=n_iter, random_state=42))
+
+    vectorizer_keys = []
+    matrices = {}
+    for candidate in candidates:
+        vectorizer_params, _ = split_params(candidate)
+        key = repr(sorted(vectorizer_params.items()))
+        if key not in matrices:
+            X = CountVectorizer(**vectorizer_params).fit_transform(df["skills"])
+            matrices[key] = train_test_split(X, test_size=0.2, random_state=42)[0]
+        vectorizer_keys.append(key)
+
+    y_train = train_test_split(y, test_size=0.2, random_state=42)[0]
+    folds = list(KFold(n_splits=cv, shuffle=True, random_state=42).split(np.arange(len(y_train))))
+    print(f"🔎 {mode.title()} search: {len(candidates)} candidates x {cv} folds, {len(matrices)} feature matrices")
+
+    scores = {i: [] for i in range(len(candidates))}
+    fit_times = {i: 0.0 for i in range(len(candidates))}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker, initargs=(matrices, y_train)) as pool:
+        futures = [
+            pool.submit(_fit_fold, i, vectorizer_keys[i], split_params(candidate)[1], train_idx, val_idx)
+            for i, candidate in enumerate(candidates)
+            for train_idx, val_idx in folds
+        ]
+        for future in as_completed(futures):
+            candidate_id, accuracy, fit_seconds = future.result()
+            scores[candidate_id].append(accuracy)
+            fit_times[candidate_id] += fit_seconds
+
+    results = [
+        {"params": candidates[i], "cv_accuracy": float(np.mean(scores[i])), "fit_seconds": fit_times[i]}
+        for i in range(len(candidates))
+    ]
+    results.sort(key=lambda r: r["cv_accuracy"], reverse=True)
+    return results[0]["params"], results
+
+def train_default(df, y):
+    """The original fixed-parameter training run."""
+    # Vectorize skills text
+    vectorizer = CountVectorizer()
+    X = vectorizer.fit_transform(df["skills"])
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    model.fit(X_train, y_train)
+    return vectorizer, model, X
+
+def train_compact(df, y, vectorizer_kind="count"):
+    """
+    The compact profile: a pruned float32 vocabulary (or a stateless hashing vectorizer) and a
+    depth/leaf-limited forest.
+
+    With CountVectorizer, terms are pruned by min_df/max_features and then chi-squared
+    selection on the training split, and the selected terms become a fixed vocabulary, so
+    the saved vectorizer only knows the columns the forest uses. With hashing there is no
+    vocabulary to store; the selected hash columns are sliced out by the second step of the
+    Pipeline saved as vectorizer.pkl.
+    """
+    profile = COMPACT_PROFILE
+    train_idx = train_test_split(np.arange(len(y)), test_size=0.2, random_state=42)[0]
+
+    if vectorizer_kind == "hashing":
+        hashing = HashingVectorizer(n_features=2 ** profile["hash_bits"], alternate_sign=False, norm=None, dtype=np.float32)
+        X_all = hashing.transform(df["skills"])
+        selector = SelectKBest(chi2, k=min(profile["k_best"], X_all.shape[1])).fit(X_all[train_idx], y[train_idx])
+        # Keep only the selected column indices: the fitted selector also holds scores_ and
+        # pvalues_ for all 2**hash_bits columns, which would dominate vectorizer.pkl
+        columns = selector.get_support(indices=True).astype(np.int32)
+        select = FunctionTransformer(itemgetter((slice(None), columns)), accept_sparse=True).fit(X_all)
+        vectorizer = Pipeline([("hashing", hashing), ("select", select)])
+        X = select.transform(X_all)
+    else:
+        counts = CountVectorizer(min_df=profile["min_df"], max_features=profile["max_features"], dtype=np.float32)
+        X_all = counts.fit_transform(df["skills"])
+        selector = SelectKBest(chi2, k=min(profile["k_best"], X_all.shape[1])).fit(X_all[train_idx], y[train_idx])
+        vectorizer = CountVectorizer(vocabulary=counts.get_feature_names_out()[selector.get_support()], dtype=np.float32)
+        X = vectorizer.fit_transform(df["skills"])
+    print(f"🗜 Compact profile: {X_all.shape[1]} candidate features -> {X.shape[1]} kept ({vectorizer_kind} vectorizer)")
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    model = RandomForestClassifier(
+        n_estimators=100,
+        max_depth=profile["max_depth"],
+        min_samples_leaf=profile["min_samples_leaf"],
+        random_state=42,
+        n_jobs=-1,
+    )
+    model.fit(X_train, y_train)
+    return vectorizer, model, X
+
+def artifact_size(path):
+    """
+    Bytes on disk of an artifact file, or of the current version of the mapped export (not
+    counting its hard link to the model pickle, which is counted as that file).
+    """
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    version_path = current_mapped_version(path)
+    if version_path is None:
+        return 0
+    stats = [os.stat(os.path.join(version_path, name)) for name in os.listdir(version_path)]
+    return sum(stat.st_size for stat in stats if stat.st_nlink == 1)
+
+def artifact_report(df):
+    """
+    Size on disk, resident memory after load and held-out accuracy of the saved artifacts (None if absent).
+    RSS and accuracy are None when the artifacts cannot be loaded (corrupt or from an incompatible version).
+    """
+    if not all(os.path.exists(MODELS_PATH + name) for name in ARTIFACT_FILES[:3]):
+        return None
+    sizes = {name: artifact_size(MODELS_PATH + name) for name in ARTIFACT_FILES if os.path.exists(MODELS_PATH + name)}
+    try:
+        rss = json.loads(subprocess.run(
+            [sys.executable, "-c", LOADED_RSS_SCRIPT, MODELS_PATH, PROJECT_ROOT], capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1])
+    except subprocess.CalledProcessError as error:
+        reason = (error.stderr.strip().splitlines() or ["no output"])[-1]
+        print(f"⚠ Could not load the artifacts in {MODELS_PATH} to measure memory: {reason}")
+        rss = {"rss_mb": None, "artifacts_rss_mb": None}
+    except (ValueError, IndexError):  # No JSON line on stdout
+        rss = {"rss_mb": None, "artifacts_rss_mb": None}
+    try:
+        # Same held-out split as training and evaluate.py
+        label_encoder = joblib.load(MODELS_PATH + "label_encoder.pkl")
+        vectorizer = joblib.load(MODELS_PATH + "vectorizer.pkl")
+        model = joblib.load(MODELS_PATH + "career_recommendation_model.pkl")
+        X_test, y_test = train_test_split(
+            vectorizer.transform(df["skills"]), label_encoder.transform(df["job title"]), test_size=0.2, random_state=42
+        )[1::2]
+        accuracy = float(accuracy_score(y_test, model.predict(X_test)))
+    except ValueError:  # Job titles changed since the old model was trained
+        accuracy = None
+    except Exception as error:  # Unreadable pickle; training must still go ahead
+        print(f"⚠ Could not load the artifacts in {MODELS_PATH}: {error!r}")
+        accuracy = None
+    return {"artifact_bytes": sizes, "total_bytes": sum(sizes.values()), **rss, "accuracy": accuracy}
+
+def print_report_comparison(before, after):
+    """Print the new artifacts' size, RSS and accuracy next to the ones they replaced."""
+    def mb(n_bytes):
+        return f"{n_bytes / 2**20:.1f} MB" if n_bytes else "-"
+
+    def value(report, key, fmt):
+        return fmt.format(report[key]) if report and report.get(key) is not None else "-"
+
+    print(f"\n📦 {'Artifact':<34}{'before':>12}{'after':>12}")
+    for name in ARTIFACT_FILES:
+        old = before["artifact_bytes"].get(name) if before else None
+        print(f"   {name:<34}{mb(old):>12}{mb(after['artifact_bytes'].get(name)):>12}")
+    print(f"   {'total on disk':<34}{mb(before and before['total_bytes']):>12}{mb(after['total_bytes']):>12}")
+    print(f"   {'RSS added by loading':<34}{value(before, 'artifacts_rss_mb', '{:.1f} MB'):>12}"
+          f"{value(after, 'artifacts_rss_mb', '{:.1f} MB'):>12}")
+    print(f"   {'held-out accuracy':<34}{value(before, 'accuracy', '{:.4f}'):>12}{value(after, 'accuracy', '{:.4f}'):>12}")
+    if before and before.get("accuracy") is not None and after.get("accuracy") is not None:
+        print(f"   Accuracy delta vs previous model: {after['accuracy'] - before['accuracy']:+.4f}")
 
-# Load cleaned dataset
-df = pd.read_csv("data/processed_data/processed_skills_data.csv")
+def train_searched(df, y, mode, n_iter, cv, workers):
+    """Search hyperparameters, then refit the best candidate and report held-out accuracy."""
+    start = time.perf_counter()
+    best, results = search(df, y, mode, n_iter, cv, workers)
+    search_seconds = time.perf_counter() - start
 
-# Convert column names to lowercase for consistency
-df.columns = df.columns.str.lower()
+    print("\n📊 Candidates (best first):")
+    for result in results:
+        print(f"  {result['cv_accuracy']:.4f} CV acc | {result['fit_seconds']:.1f}s fit | {result['params']}")
 
-# Debugging: Print column names
-print("🔍 Columns in dataset (lowercased):", df.columns.tolist())
+    vectorizer_params, forest_params = split_params(best)
+    vectorizer = CountVectorizer(**vectorizer_params)
+    X = vectorizer.fit_transform(df["skills"])
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    model = RandomForestClassifier(random_state=42, n_jobs=-1, **forest_params)
+    model.fit(X_train, y_train)
 
-# Ensure "job title" exists (lowercase)
-if "job title" not in df.columns:
-    raise ValueError("❌ ERROR: 'job title' column is missing in processed_skills_data.csv!")
+    print(f"\n🏆 Selected: {best}")
+    print(f"🎯 Held-out accuracy: {accuracy_score(y_test, model.predict(X_test)):.4f}")
+    print(f"⏱ Search wall-clock time: {search_seconds:.1f}s")
+    return vectorizer, model, X
 
-# Proceed with model training
-models_path = "data/models/"
-os.makedirs(models_path, exist_ok=True)
+def main():
+    parser = argparse.ArgumentParser(description="Train the career recommendation model.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--search", choices=["grid", "random"], help="Cross-validated hyperparameter search over SEARCH_SPACE")
+    mode.add_argument("--profile", choices=["default", "compact"], default="default",
+                      help="compact: pruned float32 vocabulary and depth/leaf-limited trees (see COMPACT_PROFILE)")
+    parser.add_argument("--n-iter", type=int, default=20, help="Candidates sampled by --search random")
+    parser.add_argument("--cv", type=int, default=3, help="Cross-validation folds for --search")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --search (default: all cores)")
+    parser.add_argument("--vectorizer", choices=["count", "hashing"], default="count",
+                        help="With --profile compact: hashing stores no vocabulary at all")
+    args = parser.parse_args()
 
-label_encoder = LabelEncoder()
-df["job title"] = label_encoder.fit_transform(df["job title"])
-joblib.dump(label_encoder, models_path + "label_encoder.pkl")
+    df = load_training_data()
 
-# Vectorize skills text
-vectorizer = CountVectorizer()
-X = vectorizer.fit_transform(df["skills"])
-y = df["job title"]
+    # Proceed with model training
+    os.makedirs(MODELS_PATH, exist_ok=True)
 
-joblib.dump(vectorizer, models_path + "vectorizer.pkl")
+    label_encoder = LabelEncoder()
+    y = label_encoder.fit_transform(df["job title"])
 
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    # Measured before the artifacts are replaced, for the size / memory / accuracy comparison
+    before = artifact_report(df)
 
-model = RandomForestClassifier(n_estimators=100, random_state=42)
-model.fit(X_train, y_train)
+    if args.search:
+        vectorizer, model, X = train_searched(df, y, args.search, args.n_iter, args.cv, args.workers)
+    elif args.profile == "compact":
+        vectorizer, model, X = train_compact(df, y, args.vectorizer)
+    else:
+        vectorizer, model, X = train_default(df, y)
 
-joblib.dump(model, models_path + "career_recommendation_model.pkl")
+    save_artifacts(label_encoder, vectorizer, model, X.shape[1])
+    print("✅ Model training completed. Model saved in:", MODELS_PATH)
+    print_report_comparison(before, artifact_report(df))
 
-print("✅ Model training completed. Model saved in:", models_path)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.llm_client import LLMError, chat_completion
+from utils.tokens import count_tokens, truncate_to_tokens
+
+# 🧮 Context budgets (estimated tokens, see utils.tokens.count_tokens)
+RECENT_TURNS_TOKENS = int(os.getenv("CHAT_RECENT_TURNS_TOKENS", "3000"))
+# After a fold only this much stays verbatim, so the next fold is several turns away
+FOLD_KEEP_TOKENS = RECENT_TURNS_TOKENS // 3
+SUMMARY_TOKENS = int(os.getenv("CHAT_SUMMARY_TOKENS", "300"))
+USER_MESSAGE_TOKENS = int(os.getenv("CHAT_USER_MESSAGE_TOKENS", "1000"))
+FOLD_INPUT_TOKENS = 3000
+SUMMARY_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Folds run off the request path; a couple of threads is plenty since each session folds rarely
+_fold_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chat-summary")
+
+SUMMARY_INSTRUCTIONS = """
+You maintain a running summary of a career-mentoring conversation. Merge the new turns into the
+existing summary. Keep the user's background, goals, constraints, decisions and any advice already
+given; drop pleasantries. Reply with the updated summary only, in under 200 words.
+"""
+
+def new_summary_state():
+    """
+    Per-conversation summary state: the summary text, how many history turns it covers, and
+    the background fold in progress (a (future, turns) pair, or None).
+    """
+    return {"text": "", "turns": 0, "pending": None}
+
+def format_turns(turns):
+    return "\n".join(f"{turn['role'].capitalize()}: {turn['content']}" for turn in turns)
+
+def fold_into_summary(summary, turns):
+    """Return summary updated with turns (one completion, cached on disk by its exact input)."""
+    content = (
+        f"Existing summary:\n{summary or '(none yet)'}\n\n"
+        f"New turns:\n{truncate_to_tokens(format_turns(turns), FOLD_INPUT_TOKENS)}"
+    )
+    updated = chat_completion(
+        [{"role": "system", "content": SUMMARY_INSTRUCTIONS}, {"role": "user", "content": content}],
+        name="chatbot.summary",
+        temperature=0.2,
+        max_tokens=SUMMARY_TOKENS,
+        cache_ttl=SUMMARY_CACHE_TTL,
+    )
+    return truncate_to_tokens(updated.strip(), SUMMARY_TOKENS)
+
+def recent_start(history, budget):
+    """Index of the oldest turn such that history[index:] fits within budget tokens."""
+    used = 0
+    for index in range(len(history) - 1, -1, -1):
+        used += count_tokens(history[index]["content"])
+        if used > budget:
+            return index + 1
+    return 0
+
+def apply_finished_fold(state):
+    """Take the result of a background fold into state once it has finished."""
+    pending = state.get("pending")
+    if pending is None or not pending[0].done():
+        return
+    future, fold_until = pending
+    state["pending"] = None
+    try:
+        state["text"] = future.result()
+        state["turns"] = fold_until
+    except LLMError:
+        pass  # Keep the old summary; the next schedule_fold() tries again
+
+def schedule_fold(history, state):
+    """
+    Call after a reply has been added to history: once the turns not yet summarized exceed
+    RECENT_TURNS_TOKENS, fold the oldest of them into the summary on a background thread,
+    keeping FOLD_KEEP_TOKENS verbatim. The result is picked up by a later build_messages(),
+    so the user never waits on a summarization call.
+    """
+    apply_finished_fold(state)
+    if state.get("pending") is not None or recent_start(history[state["turns"]:], RECENT_TURNS_TOKENS) == 0:
+        return
+    fold_until = state["turns"] + recent_start(history[state["turns"]:], FOLD_KEEP_TOKENS)
+    future = _fold_pool.submit(fold_into_summary, state["text"], list(history[state["turns"]:fold_until]))
+    state["pending"] = (future, fold_until)
+
+def build_messages(history, user_input, state):
+    """
+    Chat messages for the next request: a summary of older turns, recent turns verbatim, and
+    the new user message.
+
+    No completion is requested here: the summary is whatever schedule_fold() has produced in
+    the background so far. Recent turns are kept while they fit RECENT_TURNS_TOKENS, so the
+    prompt stays under roughly SUMMARY_TOKENS + RECENT_TURNS_TOKENS + USER_MESSAGE_TOKENS
+    however long the chat gets (turns older than the window that a still-running fold has not
+    covered yet are left out for that request). `state` (see new_summary_state) is updated in
+    place and should live in the session, so the summary is never rebuilt from scratch.
+    """
+    if state["turns"] > len(history):
+        state.update(new_summary_state())
+    apply_finished_fold(state)
+
+    recent = history[state["turns"]:]
+    recent = recent[recent_start(recent, RECENT_TURNS_TOKENS):]
+    # Mistral expects the turns after the system message to start with the user
+    while recent and recent[0]["role"] != "user":
+        recent = recent[1:]
+
+    messages = []
+    if state["text"]:
+        messages.append({"role": "system", "content": f"Summary of the earlier conversation:\n{state['text']}"})
+    messages.extend({"role": turn["role"], "content": turn["content"]} for turn in recent)
+    messages.append({"role": "user", "content": truncate_to_tokens(user_input, USER_MESSAGE_TOKENS)})
+    return messages
@@ -0,0 +1,238 @@
+"""
+Local stand-ins for the Mistral, Google Custom Search and YouTube Data APIs.
+
+The fake server answers the same request shapes the app sends, with configurable latency,
+jitter, error rate and payload size, and counts every call per endpoint. Point the app at it
+through the existing settings:
+
+    MISTRAL_API_URL=http://127.0.0.1:8710/v1/chat/completions
+    GOOGLE_SEARCH_URL=http://127.0.0.1:8710/customsearch/v1
+    YOUTUBE_SEARCH_URL=http://127.0.0.1:8710/youtube/v3/search
+
+Run from the project root:
+    python -m utils.fake_apis --port 8710 --latency-ms 300 --error-rate 0.02
+"""
+import argparse
+import hashlib
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+MISTRAL_PATH = "/v1/chat/completions"
+GOOGLE_PATH = "/customsearch/v1"
+YOUTUBE_PATH = "/youtube/v3/search"
+THUMBNAIL_PATH = "/thumbnails/"
+STATS_PATH = "/__stats"
+
+_WORDS = (
+    "career skills network recruiter resume interview python data analyst engineer manager "
+    "portfolio project mentor growth salary industry certification leadership communication"
+).split()
+
+class FakeAPIConfig:
+    """Knobs shared by every endpoint; latency is per request, payload sizes are approximate."""
+
+    def __init__(self, latency_ms=200.0, jitter_ms=50.0, error_rate=0.0, completion_words=150,
+                 thumbnail_bytes=20_000, stream_chunk_words=5):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.completion_words = completion_words
+        self.thumbnail_bytes = thumbnail_bytes
+        self.stream_chunk_words = stream_chunk_words
+
+def _text(words, seed):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+def _png(size):
+    """A valid 1x1 PNG padded to roughly `size` bytes with a text chunk (no imaging library needed)."""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0))
+    pixels = chunk(b"IDAT", zlib.compress(b"\x00\x2a\x6f\xb4"))
+    padding = chunk(b"tEXt", b"Comment\x00" + b"x" * max(0, size - 80))
+    return b"\x89PNG\r\n\x1a\n" + header + padding + pixels + chunk(b"IEND", b"")
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real APIs
+    config = None  # Set by make_server()
+    counts = None
+    counts_lock = None
+
+    def _count(self, endpoint, status):
+        with self.counts_lock:
+            self.counts[endpoint] += 1
+            if status != 200:
+                self.counts[f"{endpoint}.errors"] += 1
+
+    def _delay_or_fail(self, endpoint):
+        """Sleep for the configured latency; returns False (after sending a 503) for injected errors."""
+        config = self.config
+        delay = max(0.0, random.gauss(config.latency_ms, config.jitter_ms)) / 1000 if config.jitter_ms else config.latency_ms / 1000
+        time.sleep(delay)
+        if random.random() < config.error_rate:
+            self._count(endpoint, 503)
+            self._send(503, b'{"error": "injected failure"}')
+            return False
+        self._count(endpoint, 200)
+        return True
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if urlparse(self.path).path != MISTRAL_PATH:
+            self._send(404, b'{"error": "not found"}')
+            return
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self._delay_or_fail("mistral"):
+            return
+
+        seed = hashlib.sha256(json.dumps(payload.get("messages"), sort_keys=True).encode()).hexdigest()
+        if payload.get("response_format", {}).get("type") == "json_object":
+            rng = random.Random(seed)
+            content = json.dumps({
+                "clarity": rng.randint(4, 9), "skills": rng.randint(4, 9), "impact": rng.randint(4, 9),
+                "ats_compatible": rng.random() < 0.7,
+                "feedback": _text(self.config.completion_words // 2, seed),
+                "improvements": [_text(12, seed + str(i)) for i in range(3)],
+                "summary": _text(40, seed),
+            })
+        else:
+            content = _text(self.config.completion_words, seed)
+
+        if payload.get("stream"):
+            self._stream(content)
+        else:
+            body = {"choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]}
+            self._send(200, json.dumps(body).encode("utf-8"))
+
+    def _stream(self, content):
+        """Server-sent events with chunked transfer encoding, like the real streaming endpoint."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        words = content.split(" ")
+        step = self.config.stream_chunk_words
+        for i in range(0, len(words), step):
+            delta = " ".join(words[i:i + step]) + (" " if i + step < len(words) else "")
+            event = f"data: {json.dumps({'choices': [{'index': 0, 'delta': {'content': delta}}]})}\n\n".encode()
+            self.wfile.write(f"{len(event):x}\r\n".encode() + event + b"\r\n")
+            self.wfile.flush()
+            time.sleep(0.002)
+        done = b"data: [DONE]\n\n"
+        self.wfile.write(f"{len(done):x}\r\n".encode() + done + b"\r\n0\r\n\r\n")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path == STATS_PATH:
+            with self.counts_lock:
+                self._send(200, json.dumps(dict(self.counts)).encode("utf-8"))
+        elif url.path == GOOGLE_PATH:
+            if self._delay_or_fail("google"):
+                seed = query.get("q", "")
+                items = [
+                    {"title": _text(6, seed + str(i)), "link": f"https://example.com/{i}", "snippet": _text(30, seed + str(i))}
+                    for i in range(int(query.get("num", 10)))
+                ]
+                self._send(200, json.dumps({"items": items}).encode("utf-8"))
+        elif url.path == YOUTUBE_PATH:
+            if self._delay_or_fail("youtube"):
+                page = int(query.get("pageToken") or 0)
+                host = self.headers.get("Host")
+                items = [
+                    {
+                        "id": {"videoId": f"vid{page}x{i}"},
+                        "snippet": {
+                            "title": _text(8, f"{query.get('q')}{page}{i}"),
+                            "thumbnails": {"medium": {"url": f"http://{host}{THUMBNAIL_PATH}{page}x{i}.png"}},
+                        },
+                    }
+                    for i in range(int(query.get("maxResults", 5)))
+                ]
+                self._send(200, json.dumps({"items": items, "nextPageToken": str(page + 1)}).encode("utf-8"))
+        elif url.path.startswith(THUMBNAIL_PATH):
+            if self._delay_or_fail("thumbnail"):
+                self._send(200, _png(self.config.thumbnail_bytes), content_type="image/png")
+        else:
+            self._send(404, b'{"error": "not found"}')
+
+    def log_message(self, format, *args):
+        pass
+
+class FakeAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def urls(self):
+        """The env settings that point the app at this server."""
+        host, port = self.server_address[:2]
+        base = f"http://{host}:{port}"
+        return {
+            "MISTRAL_API_URL": base + MISTRAL_PATH,
+            "GOOGLE_SEARCH_URL": base + GOOGLE_PATH,
+            "YOUTUBE_SEARCH_URL": base + YOUTUBE_PATH,
+        }
+
+    def counts(self):
+        with self.RequestHandlerClass.counts_lock:
+            return dict(self.RequestHandlerClass.counts)
+
+def make_server(host="127.0.0.1", port=8710, config=None):
+    """A FakeAPIServer with its own config and call counters (port 0 picks a free port)."""
+    handler = type("Handler", (FakeAPIHandler,), {
+        "config": config or FakeAPIConfig(), "counts": Counter(), "counts_lock": threading.Lock(),
+    })
+    return FakeAPIServer((host, port), handler)
+
+def start_in_background(host="127.0.0.1", port=0, config=None):
+    """Start a server on a daemon thread and return it (call .shutdown() when done)."""
+    server = make_server(host, port, config)
+    threading.Thread(target=server.serve_forever, name="fake-apis", daemon=True).start()
+    return server
+
+def add_config_arguments(parser):
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Mean latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=50.0, help="Standard deviation of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--completion-words", type=int, default=150, help="Words per chat completion")
+    parser.add_argument("--thumbnail-bytes", type=int, default=20_000, help="Size of each thumbnail image")
+
+def config_from_args(args):
+    return FakeAPIConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.completion_words, args.thumbnail_bytes)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve fake Mistral, Google Search and YouTube endpoints.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8710)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, config_from_args(args))
+    print("✅ Fake APIs running; point the app at them with:")
+    for name, url in server.urls().items():
+        print(f"   {name}={url}")
+    print(f"   Call counts: http://{args.host}:{args.port}{STATS_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
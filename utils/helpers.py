@@ -0,0 +1,139 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+def percentile_ms(seconds, q):
+    """
+    q-th quantile (0-1) of durations given in seconds, in milliseconds, interpolating linearly
+    between the closest samples (numpy's default). None if there are no samples.
+    """
+    values = sorted(seconds)
+    if not values:
+        return None
+    position = q * (len(values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return (values[lower] + (values[upper] - values[lower]) * (position - lower)) * 1000
+
+def rss_mb(peak=False):
+    """
+    Resident set size of this process in MB: current (from /proc, Linux) or the peak so far.
+    Falls back to the peak where /proc is unavailable; None where neither is supported (Windows).
+    """
+    if not peak:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+        except OSError:
+            pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak_rss / 2**20 if sys.platform == "darwin" else peak_rss / 1024
+
+class TTLCache:
+    """
+    Thread-safe in-process cache with per-entry expiry and an LRU size bound.
+
+    get_or_compute() also coalesces requests: while one caller computes a missing key,
+    concurrent callers for the same key wait for that result instead of repeating the work.
+    """
+
+    def __init__(self, ttl, max_entries=1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}  # key -> Future
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    def get(self, key):
+        """Return the cached value or None (does not count towards the stats)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_or_compute(self, key, compute, ttl=None, cache_if=None):
+        """
+        Return the cached value for key, computing it once (across threads) on a miss.
+        If cache_if is given, a computed value is only stored when cache_if(value) is true.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            if cache_if is None or cache_if(value):
+                self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "inflight": len(self._inflight)}
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: on average `rate` acquisitions per second, with bursts of up
+    to `burst`. acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def acquire(self):
+        """Take one token, sleeping as long as needed; returns the seconds spent waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (the balance may go negative) so waiters queue up in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += wait
+        if wait:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# 🗄 Cache settings
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "data/cache/llm_cache.sqlite3")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+def cache_key(payload):
+    """Content address of a request: SHA-256 of its canonical JSON (model, messages, temperature, ...)."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+class LLMCache:
+    """
+    Disk-backed completion cache in SQLite, shared by every process on the host.
+
+    Entries expire after their TTL, and the cache is kept under max_entries/max_bytes by
+    evicting the least recently used rows. Hit/miss counters are kept per process.
+    """
+
+    def __init__(self, path=LLM_CACHE_PATH, max_entries=LLM_CACHE_MAX_ENTRIES, max_bytes=LLM_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS completions_accessed ON completions (accessed_at)")
+        self._conn.commit()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+    def get(self, key):
+        """Return the cached value, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM completions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            value, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self._conn.commit()
+                self._stats["misses"] += 1
+                self._stats["expired"] += 1
+                return None
+            self._conn.execute("UPDATE completions SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key, value, ttl):
+        """Store value for ttl seconds, then evict LRU entries if over the size bounds."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now + ttl, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        self._conn.execute("DELETE FROM completions WHERE expires_at <= ?", (now,))
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM completions").fetchone()
+        while count > self.max_entries or total > self.max_bytes:
+            # Drop the oldest ~10% (at least enough to get under the entry bound) in one statement
+            batch = max(count - self.max_entries, count // 10, 1)
+            self._conn.execute(
+                "DELETE FROM completions WHERE key IN (SELECT key FROM completions ORDER BY accessed_at LIMIT ?)", (batch,)
+            )
+            self._stats["evictions"] += batch
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM completions").fetchone()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM completions")
+            self._conn.commit()
+
+    def stats(self):
+        """Hit/miss counters plus current entry count and size."""
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM completions").fetchone()
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        return {**stats, "entries": count, "bytes": total, "hit_rate": stats["hits"] / lookups if lookups else 0.0}
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    """Process-wide LLMCache (opened lazily, so pages that never cache never touch the disk)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache()
+    return _cache
@@ -0,0 +1,210 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+from utils.helpers import percentile_ms
+from utils.llm_cache import cache_key, get_cache
+from utils.metrics import METRICS, increment
+
+# Load environment variables
+load_dotenv()
+
+# 🔑 Mistral settings (MISTRAL_API_URL can point at a local stand-in server for testing)
+MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
+MISTRAL_API_URL = os.getenv("MISTRAL_API_URL") or "https://api.mistral.ai/v1/chat/completions"
+DEFAULT_MODEL = "mistral-medium"
+
+CONNECT_TIMEOUT = float(os.getenv("MISTRAL_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("MISTRAL_READ_TIMEOUT", "60"))
+MAX_RETRIES = int(os.getenv("MISTRAL_MAX_RETRIES", "3"))
+BACKOFF_FACTOR = float(os.getenv("MISTRAL_BACKOFF_FACTOR", "0.5"))
+POOL_SIZE = int(os.getenv("MISTRAL_POOL_SIZE", "10"))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+class LLMError(Exception):
+    """A chat completion failed; status_code is None for network errors and timeouts."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class LLMClient:
+    """
+    Pooled client for the Mistral chat completions API.
+
+    One requests.Session keeps TCP/TLS connections alive across calls, urllib3 retries
+    429/5xx responses with exponential backoff (honouring Retry-After), every request has a
+    connect/read timeout, and per-call latency is recorded under a call-site name.
+    """
+
+    def __init__(self, api_url=MISTRAL_API_URL, api_key=MISTRAL_API_KEY, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+                 max_retries=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR, pool_size=POOL_SIZE, rate_limiter=None):
+        self.api_url = api_url
+        self.timeout = timeout
+        # Optional utils.helpers.RateLimiter shared by every request (batch jobs set it to the API quota)
+        self.rate_limiter = rate_limiter
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"})
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None,  # Retry POST too: a chat completion has no side effects
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._latencies = defaultdict(lambda: deque(maxlen=1000))
+        self._ttfts = defaultdict(lambda: deque(maxlen=1000))
+        self._counts = defaultdict(lambda: {"calls": 0, "errors": 0, "retries": 0})
+
+    def _record(self, name, elapsed, error, retries=0, ttft=None, nbytes=0):
+        METRICS.observe("mistral.request", elapsed, error, nbytes, call=name)
+        if retries:
+            increment("mistral_retries", retries, call=name)
+        with self._lock:
+            self._latencies[name].append(elapsed)
+            if ttft is not None:
+                self._ttfts[name].append(ttft)
+            counts = self._counts[name]
+            counts["calls"] += 1
+            counts["errors"] += error
+            counts["retries"] += retries
+
+    def post(self, payload, name="default", **kwargs):
+        """POST a raw payload and return the final requests.Response (after retries)."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        start = time.perf_counter()
+        try:
+            response = self.session.post(self.api_url, json=payload, timeout=self.timeout, **kwargs)
+        except requests.exceptions.RequestException:
+            self._record(name, time.perf_counter() - start, True)
+            raise
+        retries = len(getattr(getattr(response.raw, "retries", None), "history", ()) or ())
+        self._record(name, time.perf_counter() - start, response.status_code != 200, retries, nbytes=len(response.content))
+        return response
+
+    def complete(self, messages, model=DEFAULT_MODEL, temperature=0.7, name="default", cache_ttl=None, **extra):
+        """
+        Return the assistant message content for a chat completion, or raise LLMError.
+
+        Call sites opt into the shared completion cache by passing cache_ttl (seconds);
+        identical model/messages/temperature are then served from disk until the TTL expires.
+        """
+        payload = {"model": model, "messages": messages, "temperature": temperature, **extra}
+        if cache_ttl:
+            key = cache_key(payload)
+            cached = get_cache().get(key)
+            increment("llm_cache_lookups", result="hit" if cached is not None else "miss")
+            if cached is not None:
+                return cached
+            content = self.complete(messages, model=model, temperature=temperature, name=name, **extra)
+            get_cache().set(key, content, cache_ttl)
+            return content
+
+        try:
+            response = self.post(payload, name=name)
+        except requests.exceptions.RequestException as e:
+            raise LLMError(str(e)) from e
+        if response.status_code != 200:
+            raise LLMError(f"Mistral API returned status {response.status_code}", response.status_code)
+        try:
+            return response.json()["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError) as e:
+            raise LLMError(f"Unexpected Mistral API response: {e}", response.status_code) from e
+
+    def stream(self, messages, model=DEFAULT_MODEL, temperature=0.7, name="default", **extra):
+        """
+        Yield content deltas of a streamed chat completion as they arrive (server-sent events).
+
+        Time-to-first-token is recorded under `name` alongside the total latency; raises
+        LLMError if the request fails before or during the stream.
+        """
+        payload = {"model": model, "messages": messages, "temperature": temperature, "stream": True, **extra}
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        start = time.perf_counter()
+        ttft = None
+        error = True
+        nbytes = 0
+        try:
+            response = self.session.post(self.api_url, json=payload, timeout=self.timeout, stream=True)
+        except requests.exceptions.RequestException as e:
+            self._record(name, time.perf_counter() - start, True)
+            raise LLMError(str(e)) from e
+
+        try:
+            if response.status_code != 200:
+                raise LLMError(f"Mistral API returned status {response.status_code}", response.status_code)
+            # Decode each line as UTF-8 ourselves: text/event-stream responses usually carry no
+            # charset, and requests would then fall back to ISO-8859-1
+            for raw_line in response.iter_lines(chunk_size=None):
+                nbytes += len(raw_line)
+                line = raw_line.decode("utf-8")
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                delta = json.loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    if ttft is None:
+                        ttft = time.perf_counter() - start
+                    yield delta
+            error = False
+        except requests.exceptions.RequestException as e:
+            raise LLMError(str(e)) from e
+        except (ValueError, KeyError, IndexError) as e:
+            raise LLMError(f"Unexpected Mistral API stream chunk: {e}", response.status_code) from e
+        finally:
+            response.close()
+            self._record(name, time.perf_counter() - start, error, ttft=ttft, nbytes=nbytes)
+
+    def stats(self):
+        """Per call-site counters and latency percentiles (ms)."""
+        with self._lock:
+            snapshot = {
+                name: (list(latencies), list(self._ttfts.get(name, ())), dict(self._counts[name]))
+                for name, latencies in self._latencies.items()
+            }
+
+        return {
+            name: {
+                **counts,
+                "p50_ms": percentile_ms(latencies, 0.5),
+                "p95_ms": percentile_ms(latencies, 0.95),
+                "max_ms": percentile_ms(latencies, 1.0),
+                "ttft_p50_ms": percentile_ms(ttfts, 0.5),
+            }
+            for name, (latencies, ttfts, counts) in snapshot.items()
+        }
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """Process-wide LLMClient, so every page shares one connection pool."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = LLMClient()
+    return _client
+
+def chat_completion(messages, model=DEFAULT_MODEL, temperature=0.7, name="default", cache_ttl=None, **extra):
+    """Shortcut for get_client().complete(...)."""
+    return get_client().complete(messages, model=model, temperature=temperature, name=name, cache_ttl=cache_ttl, **extra)
+
+def stream_chat_completion(messages, model=DEFAULT_MODEL, temperature=0.7, name="default", **extra):
+    """Shortcut for get_client().stream(...)."""
+    return get_client().stream(messages, model=model, temperature=temperature, name=name, **extra)
@@ -0,0 +1,197 @@
+"""
+Load generator for the Streamlit app.
+
+Runs N concurrent simulated sessions, each a plain streamlit.testing AppTest of app.py in its
+own process (AppTest keeps per-process global state, so sessions cannot share one), that
+selects a page and repeats that page's interactions (the resume page cannot upload files
+under AppTest, so its sessions call the page's analysis function directly). Outbound calls
+go to the fake APIs in utils/fake_apis.py, started in-process unless --fake-url points at a
+running one. Reports throughput, latency percentiles per page and outbound calls per endpoint.
+
+Run from the project root:
+    python -m utils.load_test --sessions 20 --iterations 5 --pages chatbot networking youtube
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import requests
+
+from utils.fake_apis import STATS_PATH, add_config_arguments, config_from_args, start_in_background
+from utils.helpers import percentile_ms
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+PAGE_LABELS = {
+    "chatbot": "💬 Chatbot",
+    "networking": "🤝 Networking",
+    "youtube": "🎥 YouTube Career Search",
+    "resume": "📂 Resume Upload",
+}
+QUESTIONS = [
+    "How do I move from data analysis into machine learning?",
+    "What should I put in a cover letter for a product manager role?",
+    "How can I negotiate a higher starting salary?",
+    "Which certifications help a cloud engineer?",
+]
+PROFESSIONS = ["Data Scientist", "Software Engineer", "Product Manager", "UX Designer", "Nurse"]
+LOCATIONS = ["New York", "London", "Berlin", "Toronto", "Remote"]
+RESUME_SECTIONS = ["SUMMARY", "EXPERIENCE", "EDUCATION", "SKILLS", "PROJECTS", "CERTIFICATIONS"]
+
+def find(elements, label):
+    return next(element for element in elements if element.label.startswith(label))
+
+def page_failed(at):
+    return bool(at.exception) or any(error.value.startswith("⚠") for error in at.error)
+
+class Session:
+    """One simulated user: its own AppTest (session state, widgets) on the chosen page."""
+
+    def __init__(self, page, distinct, timeout):
+        from streamlit.testing.v1 import AppTest
+
+        self.page = page
+        self.distinct = distinct
+        self.rng = random.Random()
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        if page != "resume":
+            self.at.run()
+            self.at.sidebar.radio[0].set_value(PAGE_LABELS[page]).run()
+
+    def variant(self, text):
+        return f"{text} {self.rng.randrange(self.distinct)}" if self.distinct > 1 else text
+
+    def interact(self):
+        """One user action on the page; returns True if it rendered without an error."""
+        at = self.at
+        if self.page == "chatbot":
+            at.chat_input[0].set_value(self.variant(self.rng.choice(QUESTIONS))).run()
+        elif self.page == "networking":
+            find(at.text_input, "Enter Your Profession").input(self.variant(self.rng.choice(PROFESSIONS)))
+            find(at.text_input, "Enter Your Location").input(self.rng.choice(LOCATIONS))
+            find(at.text_area, "Any Specific Concerns").input("How do I meet hiring managers?")
+            find(at.button, "Find Networking Opportunities").click().run()
+        elif self.page == "youtube":
+            find(at.text_input, "🔎 Search YouTube").input(self.variant("career in data science")).run()
+            if not page_failed(at):
+                find(at.button, "Next").click().run()
+                find(at.button, "▶️ Play 1").click().run()
+        elif self.page == "resume":
+            return self.analyze_resume()
+        return not page_failed(at)
+
+    def analyze_resume(self):
+        from components.resume_upload import ANALYSIS_ERROR_FEEDBACK, fetch_resume_analysis
+
+        sections = self.rng.randint(3, len(RESUME_SECTIONS))
+        text = "\n".join(
+            f"{heading}\n" + "Led projects with Python and SQL, improving reporting speed. " * self.rng.randint(5, 120)
+            for heading in RESUME_SECTIONS[:sections]
+        )
+        return fetch_resume_analysis(self.variant(text))[0] != ANALYSIS_ERROR_FEEDBACK
+
+def run_session(index, page, iterations, distinct, timeout):
+    """
+    One simulated user, run in a worker process; returns (page, latencies, failures, first,
+    last) where first/last are the wall-clock bounds of its interactions.
+    """
+    try:
+        session = Session(page, distinct, timeout)
+    except Exception as e:
+        print(f"⚠ Session {index} ({page}) failed to start: {e}", file=sys.stderr)
+        return page, [], iterations, None, None
+    latencies, failures = [], 0
+    first = time.time()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        try:
+            ok = session.interact()
+        except Exception as e:
+            print(f"⚠ Session {index} ({page}): {type(e).__name__}: {e}", file=sys.stderr)
+            ok = False
+        latencies.append(time.perf_counter() - start)
+        failures += not ok
+    return page, latencies, failures, first, time.time()
+
+def run_load(pages, sessions, iterations, distinct, timeout):
+    """
+    Run `sessions` concurrent sessions (pages assigned round-robin), one process each; returns
+    timings and failures per page and the wall-clock time spanned by the interactions.
+    """
+    timings = {page: [] for page in pages}
+    failures = {page: 0 for page in pages}
+    spans = []
+    # spawn: every session gets a clean interpreter, the same on Linux as on Windows
+    with ProcessPoolExecutor(max_workers=sessions, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [
+            pool.submit(run_session, index, pages[index % len(pages)], iterations, distinct, timeout)
+            for index in range(sessions)
+        ]
+        for future in futures:
+            page, latencies, failed, first, last = future.result()
+            timings[page].extend(latencies)
+            failures[page] += failed
+            if first is not None:
+                spans.append((first, last))
+    elapsed = max(last for _, last in spans) - min(first for first, _ in spans) if spans else 0.0
+    return timings, failures, elapsed
+
+def fake_api_counts(server, fake_url):
+    if server is not None:
+        return server.counts()
+    return requests.get(fake_url.rstrip("/") + STATS_PATH, timeout=10).json()
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive app pages with concurrent simulated sessions.")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent simulated users")
+    parser.add_argument("--iterations", type=int, default=5, help="Interactions per session")
+    parser.add_argument("--pages", nargs="+", choices=sorted(PAGE_LABELS), default=["chatbot", "networking", "youtube"])
+    parser.add_argument("--distinct", type=int, default=20, help="Distinct query variants (lower means more cache hits)")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds allowed per page run")
+    parser.add_argument("--fake-url", help="Use fake APIs already running at this base URL instead of starting them")
+    parser.add_argument("--keep-llm-cache", action="store_true", help="Use the real LLM cache file instead of a temporary one")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    if args.fake_url:
+        base = args.fake_url.rstrip("/")
+        urls = {"MISTRAL_API_URL": f"{base}/v1/chat/completions", "GOOGLE_SEARCH_URL": f"{base}/customsearch/v1",
+                "YOUTUBE_SEARCH_URL": f"{base}/youtube/v3/search"}
+    else:
+        server = start_in_background(config=config_from_args(args))
+        urls = server.urls()
+    # Settings are read at import time, so they must be in place before any page module loads
+    os.environ.update(urls)
+    for key in ("MISTRAL_API_KEY", "GOOGLE_API_KEY", "SEARCH_ENGINE_ID", "YOUTUBE_API_KEY"):
+        os.environ.setdefault(key, "load-test")
+    if not args.keep_llm_cache:
+        os.environ["LLM_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="load_test_"), "llm_cache.sqlite3")
+
+    before = fake_api_counts(server, args.fake_url)
+    timings, failures, elapsed = run_load(args.pages, args.sessions, args.iterations, args.distinct, args.timeout)
+    after = fake_api_counts(server, args.fake_url)
+
+    interactions = sum(len(t) for t in timings.values())
+    print(f"\n📊 {args.sessions} sessions × {args.iterations} interactions in {elapsed:.1f}s "
+          f"— {interactions / elapsed if elapsed else 0:.2f} interactions/sec")
+    print(f"{'Page':<12}{'Runs':>6}{'Errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for page in args.pages:
+        values = timings[page]
+        columns = "".join(f"{percentile_ms(values, q):>10.1f}" if values else f"{'-':>10}" for q in (0.5, 0.95, 0.99, 1.0))
+        print(f"{page:<12}{len(values):>6}{failures[page]:>8}{columns}")
+    print("\n🌐 Outbound calls")
+    for endpoint in sorted(set(after) | set(before)):
+        calls = after.get(endpoint, 0) - before.get(endpoint, 0)
+        per_interaction = f" ({calls / interactions:.2f} per interaction)" if interactions and not endpoint.endswith(".errors") else ""
+        print(f"   {endpoint:<20}{calls:>8}{per_interaction}")
+
+    if server is not None:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
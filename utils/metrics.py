@@ -0,0 +1,214 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 📈 Metric settings (set METRICS_PORT to serve /metrics for Prometheus from the app process)
+METRICS_PREFIX = "career_mentor"
+METRICS_PORT = os.getenv("METRICS_PORT")
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+class Metrics:
+    """
+    Thread-safe, in-process registry of timing spans and counters.
+
+    Every span name gets a latency histogram plus call, error and byte counters, keyed by
+    the span's labels. Recording is a lock and a few additions, so it is cheap enough to
+    leave on in production.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._spans = {}  # (name, labels) -> {"calls", "errors", "bytes", "seconds", "buckets"}
+        self._counters = {}  # (name, labels) -> value
+
+    def observe(self, name, seconds, error=False, nbytes=0, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            entry = self._spans.get(key)
+            if entry is None:
+                entry = self._spans[key] = {"calls": 0, "errors": 0, "bytes": 0, "seconds": 0.0,
+                                            "buckets": [0] * len(self.buckets)}
+            entry["calls"] += 1
+            entry["errors"] += error
+            entry["bytes"] += nbytes
+            entry["seconds"] += seconds
+            index = bisect_left(self.buckets, seconds)
+            if index < len(self.buckets):
+                entry["buckets"][index] += 1
+
+    def increment(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self):
+        """{"spans": {(name, labels): stats}, "counters": {(name, labels): value}} copied under the lock."""
+        with self._lock:
+            return {
+                "spans": {key: {**entry, "buckets": list(entry["buckets"])} for key, entry in self._spans.items()},
+                "counters": dict(self._counters),
+            }
+
+    def summary(self):
+        """Per-span calls, errors, bytes and mean latency (ms), for display."""
+        rows = []
+        for (name, labels), entry in sorted(self.snapshot()["spans"].items()):
+            rows.append({
+                "span": name + "".join(f" {k}={v}" for k, v in labels),
+                "calls": entry["calls"],
+                "errors": entry["errors"],
+                "bytes": entry["bytes"],
+                "mean_ms": round(entry["seconds"] / entry["calls"] * 1000, 2),
+            })
+        return rows
+
+    def export_prometheus(self):
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        snapshot = self.snapshot()
+
+        def label_text(labels, **extra):
+            pairs = list(labels) + list(extra.items())
+            if not pairs:
+                return ""
+            escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+            return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+        lines = []
+        for family, metric_type, help_text in (
+            ("span_seconds", "histogram", "Latency of instrumented operations."),
+            ("span_calls_total", "counter", "Calls of instrumented operations."),
+            ("span_errors_total", "counter", "Instrumented operations that raised."),
+            ("span_bytes_total", "counter", "Bytes read or received by instrumented operations."),
+        ):
+            metric = f"{METRICS_PREFIX}_{family}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {metric_type}"]
+            for (name, labels), entry in sorted(snapshot["spans"].items()):
+                labels = (("span", name),) + labels
+                if family == "span_seconds":
+                    cumulative = 0
+                    for bound, count in zip(self.buckets, entry["buckets"]):
+                        cumulative += count
+                        lines.append(f"{metric}_bucket{label_text(labels, le=bound)} {cumulative}")
+                    lines.append(f"{metric}_bucket{label_text(labels, le='+Inf')} {entry['calls']}")
+                    lines.append(f"{metric}_sum{label_text(labels)} {entry['seconds']:.6f}")
+                    lines.append(f"{metric}_count{label_text(labels)} {entry['calls']}")
+                else:
+                    field = family[len("span_"):-len("_total")]
+                    lines.append(f"{metric}{label_text(labels)} {entry[field]}")
+
+        for name in sorted({name for name, _ in snapshot["counters"]}):
+            metric = f"{METRICS_PREFIX}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (counter_name, labels), value in sorted(snapshot["counters"].items()):
+                if counter_name == name:
+                    lines.append(f"{metric}{label_text(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+METRICS = Metrics()
+
+class Span:
+    """Handle yielded by span(); call add_bytes() with payload sizes as they become known."""
+
+    __slots__ = ("bytes",)
+
+    def __init__(self):
+        self.bytes = 0
+
+    def add_bytes(self, nbytes):
+        self.bytes += nbytes or 0
+
+@contextmanager
+def span(name, **labels):
+    """
+    Time the enclosed block under `name`; an exception counts as an error and is re-raised.
+    BaseExceptions (Streamlit's st.rerun()/st.stop() signals) are timed but not errors.
+    """
+    handle = Span()
+    start = time.perf_counter()
+    error = False
+    try:
+        yield handle
+    except Exception:
+        error = True
+        raise
+    finally:
+        METRICS.observe(name, time.perf_counter() - start, error, handle.bytes, **labels)
+
+def increment(name, value=1, **labels):
+    """Add to a plain counter, exported as <prefix>_<name>_total."""
+    METRICS.increment(name, value, **labels)
+
+def export_prometheus():
+    return METRICS.export_prometheus()
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        data = export_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+_server = None
+_server_lock = threading.Lock()
+
+def start_metrics_server(port=METRICS_PORT, host="0.0.0.0"):
+    """Serve /metrics on `port` from a daemon thread, once per process; no-op when port is unset."""
+    global _server
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, int(port)), _MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+    return _server
+
+# Python 3.12+ allows one active profiler per process, so concurrent sessions take turns
+_profile_lock = threading.Lock()
+
+@contextmanager
+def profiled(enabled=True):
+    """
+    Run the enclosed block under cProfile when enabled; yields a dict whose "report" key holds
+    the top functions by cumulative time once the block exits.
+    """
+    result = {"report": None}
+    if not enabled:
+        yield result
+        return
+    if not _profile_lock.acquire(blocking=False):
+        result["report"] = "Another session is being profiled; try again in a moment."
+        yield result
+        return
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+        try:
+            yield result
+        finally:
+            profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(30)
+            result["report"] = out.getvalue()
+    finally:
+        _profile_lock.release()
@@ -0,0 +1,33 @@
+import os
+
+import requests
+from utils.metrics import span
+
+# 🔌 Set PREDICTION_SERVER_URL (e.g. http://127.0.0.1:8502) to score via training/serve.py
+PREDICTION_SERVER_URL = os.getenv("PREDICTION_SERVER_URL", "").rstrip("/")
+PREDICTION_TIMEOUT = float(os.getenv("PREDICTION_TIMEOUT", "30"))
+
+_session = requests.Session()
+
+def get_job_recommendation(skills_input):
+    """
+    Same result dict as training.predict.get_job_recommendation.
+
+    With PREDICTION_SERVER_URL set the request goes to the shared micro-batching server, so
+    this process never loads the model (or pandas); otherwise it is scored in-process.
+    """
+    if not PREDICTION_SERVER_URL:
+        from training.predict import get_job_recommendation as predict_locally
+
+        return predict_locally(skills_input)
+
+    try:
+        with span("prediction.remote") as remote_span:
+            response = _session.post(
+                f"{PREDICTION_SERVER_URL}/recommend", json={"skills": skills_input}, timeout=PREDICTION_TIMEOUT
+            )
+            remote_span.add_bytes(len(response.content))
+            response.raise_for_status()
+            return response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        return {"error": f"Prediction server unavailable: {e}"}
@@ -0,0 +1,167 @@
+import hashlib
+import io
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.helpers import TTLCache
+from utils.metrics import METRICS, span
+
+# 📂 Resume extraction settings
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "10"))
+PAGE_TIMEOUT = float(os.getenv("RESUME_PAGE_TIMEOUT", "15"))
+EXTRACTION_WORKERS = int(os.getenv("RESUME_EXTRACTION_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Under `streamlit run`, __main__ is the app script, which "spawn" workers would re-execute;
+# fork avoids that where the platform supports it (Windows only has spawn).
+START_METHOD = os.getenv(
+    "RESUME_EXTRACTION_START_METHOD",
+    "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn",
+)
+
+# Separates pages in the extracted text, so later steps (utils.tokens.compact_text) know the page edges
+PAGE_BREAK = "\f"
+
+# Keyed by SHA-256 of the file content: the same file is never parsed twice
+_extraction_cache = TTLCache(ttl=24 * 60 * 60, max_entries=256)
+_pool = None
+_pool_lock = threading.Lock()
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _pdf_page_count(data):
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return len(pdf.pages)
+
+def _extract_pdf_page(data, page_number):
+    """Worker: text of one PDF page (extract_text() is called once, not twice)."""
+    import pdfplumber
+
+    start = time.perf_counter()
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        text = pdf.pages[page_number].extract_text() or ""
+    return text, time.perf_counter() - start
+
+def _extract_docx(data):
+    """Worker: paragraph text of a DOCX file (treated as a single page)."""
+    import docx
+
+    start = time.perf_counter()
+    document = docx.Document(io.BytesIO(data))
+    text = "\n".join(para.text for para in document.paragraphs)
+    return text, time.perf_counter() - start
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Import the parsers before forking so workers never import while other threads hold locks
+            import docx  # noqa: F401
+            import pdfplumber  # noqa: F401
+
+            _pool = ProcessPoolExecutor(max_workers=EXTRACTION_WORKERS, mp_context=multiprocessing.get_context(START_METHOD))
+        return _pool
+
+def _retire_pool(pool):
+    """
+    Stop handing out `pool` after a timeout or crash; the next caller gets a fresh one.
+
+    A stuck worker cannot be cancelled, and terminating it would break every other session's
+    in-flight pages, so the old pool is only shut down without waiting: work already
+    submitted drains (or fails) on its own and the workers exit once it is done.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+def _submit_all(tasks):
+    """Submit every task, retrying once on a fresh pool if the shared one has broken."""
+    pool = _get_pool()
+    try:
+        return pool, [pool.submit(fn, *args) for fn, args in tasks]
+    except BrokenProcessPool:
+        _retire_pool(pool)
+        pool = _get_pool()
+        return pool, [pool.submit(fn, *args) for fn, args in tasks]
+
+def _extract(data, file_type):
+    if file_type == PDF_MIME:
+        n_pages = _pdf_page_count(data)
+        tasks = [(_extract_pdf_page, (data, i)) for i in range(min(n_pages, MAX_PAGES))]
+    elif file_type == DOCX_MIME:
+        n_pages = 1
+        tasks = [(_extract_docx, (data,))]
+    else:
+        raise ValueError(f"Unsupported resume type: {file_type}")
+
+    pool, futures = _submit_all(tasks)
+    # One deadline for the whole file: PAGE_TIMEOUT per wave of pages the pool runs in parallel
+    wait(futures, timeout=PAGE_TIMEOUT * math.ceil(len(tasks) / EXTRACTION_WORKERS))
+
+    texts, page_seconds, timed_out, failed = [], [], [], []
+    broken = False
+    for page_number, future in enumerate(futures, start=1):
+        if not future.done():
+            future.cancel()  # Only still-queued pages can be cancelled; running ones are left to finish
+            timed_out.append(page_number)
+        elif future.exception() is not None:
+            failed.append(page_number)
+            broken = broken or isinstance(future.exception(), BrokenProcessPool)
+        else:
+            text, seconds = future.result()
+            texts.append(text)
+            page_seconds.append(seconds)
+            continue
+        texts.append("")
+        page_seconds.append(None)
+    if timed_out or broken:
+        _retire_pool(pool)
+
+    return {
+        "text": f"\n{PAGE_BREAK}\n".join(t.strip() for t in texts if t.strip()),
+        "pages": n_pages,
+        "pages_extracted": len(tasks) - len(timed_out) - len(failed),
+        "page_seconds": page_seconds,
+        "timed_out_pages": timed_out,
+        "failed_pages": failed,
+        "truncated": n_pages > len(tasks),
+    }
+
+def extraction_complete(result):
+    """True if no page timed out or crashed, i.e. the text is worth caching."""
+    return not result["timed_out_pages"] and not result["failed_pages"]
+
+def extract_resume(data, file_type):
+    """
+    Extract resume text from raw PDF/DOCX bytes.
+
+    PDF pages (up to MAX_PAGES) are extracted in parallel on a process pool under one overall
+    deadline (PAGE_TIMEOUT per wave of parallel pages); DOCX files take the same path as a
+    single task. Pages that time out or whose worker crashed come back empty and are listed
+    in timed_out_pages / failed_pages. Complete results are cached by content hash; incomplete
+    ones are not, so the next call retries them. Returns a dict with the text, per-page timings and whether it was cached.
+    """
+    key = (content_hash(data), file_type)
+    cached = _extraction_cache.get(key)
+    if cached is not None:
+        return {**cached, "cached": True}
+    def extract():
+        with span("resume.extract", type="pdf" if file_type == PDF_MIME else "docx") as extract_span:
+            extract_span.add_bytes(len(data))
+            result = _extract(data, file_type)
+        for seconds in result["page_seconds"]:
+            if seconds is not None:
+                METRICS.observe("resume.extract_page", seconds)
+        return result
+
+    return {**_extraction_cache.get_or_compute(key, extract, cache_if=extraction_complete), "cached": False}
@@ -0,0 +1,82 @@
+"""
+Startup import-cost report for the Streamlit app.
+
+Each page module listed in app.py's PAGES (plus training.predict, which the Job Prediction
+page loads) is imported in a fresh interpreter under `python -X importtime`, after
+streamlit itself, so the numbers are what selecting that page adds to a cold start.
+
+Run from the project root:
+    python -m utils.startup_profile [--repeat 3] [--top 5] [module ...]
+"""
+import argparse
+import ast
+import re
+import subprocess
+import sys
+
+BASELINE_MODULE = "streamlit"
+EXTRA_MODULES = ["training.predict"]
+PROJECT_PACKAGES = {"components", "utils", "training"}
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def page_modules(app_path="app.py"):
+    """Modules referenced by "module:function" entries of PAGES in app.py (parsed, not imported)."""
+    with open(app_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "PAGES" for t in node.targets):
+            pages = ast.literal_eval(node.value)
+            return [target.split(":")[0] for target in pages.values() if ":" in target]
+    return []
+
+def import_profile(module, baseline=BASELINE_MODULE):
+    """
+    Import `module` in a fresh interpreter after `baseline`; returns (total_ms, dependencies),
+    where dependencies maps each third-party package newly imported by it to its cumulative ms.
+    """
+    code = f"import {baseline}; import {module}" if baseline else f"import {module}"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    # Lines after the baseline's own (outermost) line belong to the module under test
+    lines = result.stderr.splitlines()
+    start = 0
+    for i, line in enumerate(lines):
+        match = _IMPORTTIME_LINE.match(line)
+        if baseline and match and match.group(4) == baseline and len(match.group(3)) <= 1:
+            start = i + 1
+
+    total_us = 0
+    dependencies = {}
+    for line in lines[start:]:
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, depth, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if depth <= 1:  # Outermost imports (one space of padding)
+            total_us += cumulative
+        package = name.split(".")[0]
+        if package not in PROJECT_PACKAGES:
+            dependencies[package] = max(dependencies.get(package, 0), cumulative)
+    return total_us / 1000, {name: us / 1000 for name, us in dependencies.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the import cost of each app page module.")
+    parser.add_argument("modules", nargs="*", help="Modules to profile (default: the app's pages)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per module; the fastest is reported")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest dependencies listed per module")
+    args = parser.parse_args()
+
+    modules = args.modules or page_modules() + EXTRA_MODULES
+    baseline_ms = min(import_profile(BASELINE_MODULE, baseline=None)[0] for _ in range(args.repeat))
+    print(f"{BASELINE_MODULE} (always loaded): {baseline_ms:.0f} ms")
+    print(f"{'Module':<32}{'Import ms':>10}  Heaviest new dependencies")
+    for module in modules:
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        total_ms, dependencies = min(runs, key=lambda run: run[0])
+        heaviest = sorted(dependencies.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        print(f"{module:<32}{total_ms:>10.0f}  " + ", ".join(f"{name} {ms:.0f}" for name, ms in heaviest))
+
+if __name__ == "__main__":
+    main()
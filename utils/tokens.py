@@ -0,0 +1,70 @@
+import math
+import re
+from collections import Counter
+
+from utils.resume_text import PAGE_BREAK
+
+# Word pieces and single punctuation marks, roughly how BPE tokenizers split English text
+_PIECES = re.compile(r"\w+|[^\w\s]")
+_PAGE_MARKER = re.compile(r"^(page\s*\d+(\s*(of|/)\s*\d+)?|\d+\s*/\s*\d+)$", re.IGNORECASE)
+_BOILERPLATE = re.compile(r"^(references\s+(are\s+)?available\s+(up)?on\s+request\.?|curriculum\s+vitae|resume|cv)$", re.IGNORECASE)
+_DECORATION = re.compile(r"^[\W_]+$")
+EDGE_LINES = 2  # Lines at the top and bottom of each page that may be running headers/footers
+
+def count_tokens(text):
+    """
+    Estimate the token count of text for budgeting.
+
+    No tokenizer ships with the app, so this takes the larger of ~4 characters per token and
+    one token per word/punctuation piece, which errs on the high side for English prose.
+    """
+    if not text:
+        return 0
+    return max(math.ceil(len(text) / 4), len(_PIECES.findall(text)))
+
+def compact_text(text):
+    """
+    Shrink extracted document text without losing content: normalize whitespace, drop page
+    markers, decorative rules and stock boilerplate, and remove running headers/footers.
+
+    Pages are separated by resume_text.PAGE_BREAK. A short line counts as a header/footer
+    only if it sits within EDGE_LINES of the top or bottom of every page, and only those
+    edge copies are dropped, so lines that merely repeat in the body are kept.
+    """
+    pages = [[" ".join(line.split()) for line in page.splitlines()] for page in text.split(PAGE_BREAK)]
+    edges = []  # Per page, the indices of its first and last EDGE_LINES non-empty lines
+    edge_counts = Counter()
+    for page in pages:
+        filled = [i for i, line in enumerate(page) if line]
+        page_edges = set(filled[:EDGE_LINES] + filled[-EDGE_LINES:])
+        edges.append(page_edges)
+        edge_counts.update({page[i] for i in page_edges})
+    running = {line for line, n in edge_counts.items() if len(pages) >= 2 and n >= len(pages) and len(line) <= 80}
+
+    kept = []
+    for page, page_edges in zip(pages, edges):
+        for i, line in enumerate(page):
+            if not line:
+                if kept and kept[-1]:
+                    kept.append("")
+                continue
+            if (i in page_edges and line in running) or _PAGE_MARKER.match(line) or _BOILERPLATE.match(line) \
+                    or _DECORATION.match(line):
+                continue
+            kept.append(line)
+    return "\n".join(kept).strip()
+
+def truncate_to_tokens(text, budget):
+    """Cut text so that count_tokens(text) <= budget, preferring a line boundary."""
+    if count_tokens(text) <= budget:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(text[:mid]) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    cut = text[:low]
+    newline = cut.rfind("\n")
+    return cut[:newline] if newline > low // 2 else cut